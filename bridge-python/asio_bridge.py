@@ -16,13 +16,19 @@ import json
 import logging
 import time
 import threading
+import queue
 import struct
-import base64
+import math
+import itertools
+import functools
 import sys
 import os
-from typing import Dict, Optional, Any, List, Callable
-from dataclasses import dataclass, field
-from collections import deque
+import subprocess
+import ctypes
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any, List, Callable, Tuple
+from dataclasses import dataclass, field, replace
 import numpy as np
 
 # Windows Registry pour détecter les drivers ASIO
@@ -55,6 +61,30 @@ try:
 except ImportError:
     COMTYPES_AVAILABLE = False
 
+# Numba pour compiler les noyaux audio temps réel (optionnel)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# orjson pour sérialiser les messages de contrôle (optionnel)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Boucle asyncio accélérée (optionnel): winloop sur Windows, uvloop ailleurs
+try:
+    if sys.platform == 'win32':
+        import winloop as fast_loop
+    else:
+        import uvloop as fast_loop
+    FAST_LOOP_AVAILABLE = True
+except ImportError:
+    FAST_LOOP_AVAILABLE = False
+
 # WebSocket
 import websockets
 from websockets.server import WebSocketServerProtocol
@@ -68,16 +98,170 @@ logging.basicConfig(
 logger = logging.getLogger('NovaASIO')
 
 
+# ─────────────────────────────────────────────────────────────────
+# NOYAUX AUDIO
+# ─────────────────────────────────────────────────────────────────
+
+if NUMBA_AVAILABLE:
+    # Signatures explicites: compilation à l'import (pas de JIT au premier
+    # callback audio), blocs C-contigus et vues strided
+    @njit(['float32(float32[:, ::1], float32[::1], float64[::1], int64[::1])',
+           'float32(float32[:, :], float32[::1], float64[::1], int64[::1])'],
+          cache=True, fastmath=True, nogil=True)
+    def _meter_block(x, peaks, sum_sq, clips):
+        """
+        Mesurer un bloc (frames, channels) en une seule passe
+        
+        Écrit la crête et la somme des carrés de chaque canal, cumule les
+        échantillons écrêtés (|v| >= 1) et retourne la crête globale.
+        """
+        channels = x.shape[1]
+        for j in range(channels):
+            peaks[j] = 0.0
+            sum_sq[j] = 0.0
+        for i in range(x.shape[0]):
+            for j in range(channels):
+                v = x[i, j]
+                a = abs(v)
+                if a > peaks[j]:
+                    peaks[j] = a
+                sum_sq[j] += v * v
+                if a >= 1.0:
+                    clips[j] += 1
+        m = np.float32(0.0)
+        for j in range(channels):
+            if peaks[j] > m:
+                m = peaks[j]
+        return m
+else:
+    def _meter_block(x: np.ndarray, peaks: np.ndarray, sum_sq: np.ndarray,
+                     clips: np.ndarray) -> float:
+        """Mesurer un bloc par canal: crête, somme des carrés, écrêtages cumulés"""
+        np.maximum(x.max(axis=0), -x.min(axis=0), out=peaks)
+        np.einsum('ij,ij->j', x, x, out=sum_sq, dtype=np.float64)
+        clips += (np.abs(x) >= 1.0).sum(axis=0)
+        return float(peaks.max())
+
+
+if NUMBA_AVAILABLE:
+    @njit(['void(float32[:, ::1], int16[:, ::1])', 'void(float32[:, :], int16[:, ::1])'],
+          cache=True, fastmath=True, nogil=True)
+    def _quantize_i16(x, out):
+        """Quantifier un bloc float32 en int16 (x 32767, saturé) en une seule passe"""
+        for i in range(x.shape[0]):
+            for j in range(x.shape[1]):
+                v = x[i, j] * np.float32(32767.0)
+                if v > 32767.0:
+                    v = np.float32(32767.0)
+                elif v < -32768.0:
+                    v = np.float32(-32768.0)
+                out[i, j] = np.int16(v)
+else:
+    # Sans numba: quantification via un tampon float32 (voir _encode_audio_frame)
+    _quantize_i16 = None
+
+
+def _new_meter(channels: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tableaux (crêtes, sommes des carrés, écrêtages) pré-alloués pour _meter_block"""
+    return (np.zeros(channels, dtype=np.float32),
+            np.zeros(channels, dtype=np.float64),
+            np.zeros(channels, dtype=np.int64))
+
+
+# ─────────────────────────────────────────────────────────────────
+# SÉRIALISATION (JSON ET TRAMES AUDIO)
+# ─────────────────────────────────────────────────────────────────
+
+if ORJSON_AVAILABLE:
+    def _json_dumps(data: Any) -> str:
+        """Sérialiser avec orjson (décodé pour rester en trame texte)"""
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    _json_loads = orjson.loads
+else:
+    def _json_default(obj: Any) -> Any:
+        """Convertir les tableaux et scalaires numpy pour json.dumps"""
+        if isinstance(obj, (np.ndarray, np.generic)):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    _json_dumps = functools.partial(json.dumps, default=_json_default)
+    _json_loads = json.loads
+
+# Début pré-sérialisé de la réponse STATS (envoyée à haute fréquence)
+_STATS_ENVELOPE = '{"action":"STATS","stats":'
+
+# En-tête des trames audio binaires: [uint32 num_samples][uint32 num_channels]
+_AUDIO_HEADER = struct.Struct('<II')
+
+# Durée maximale d'audio reçu en attente d'écriture (au-delà: les plus
+# anciennes trames sont abandonnées)
+_AUDIO_IN_MAX_SECONDS = 0.2
+
+
+def _audio_in_queue_limit(config: 'ASIOConfig') -> int:
+    """Nombre d'échantillons (frames) reçus couvrant _AUDIO_IN_MAX_SECONDS pour cette config"""
+    return max(config.block_size, math.ceil(_AUDIO_IN_MAX_SECONDS * config.sample_rate))
+
+
+# Granularité de block_size: les boucles SIMD de numpy (copies, max/abs des
+# métriques) et les tailles FFT usuelles n'ont alors pas de reste à traiter
+_BLOCK_SIZE_GRANULARITY = 32
+
+
 @dataclass
 class ASIOConfig:
     """Configuration ASIO"""
     device_name: Optional[str] = None  # None = périphérique par défaut
     sample_rate: int = 44100
-    block_size: int = 256  # Taille du buffer ASIO (latence)
+    block_size: int = 256  # Taille du buffer ASIO (latence), multiple de 32 (minimum 32)
     input_channels: int = 2
     output_channels: int = 2
     bit_depth: int = 32  # 16, 24 ou 32 bits float
     use_asio: bool = True  # Utiliser ASIO si disponible
+    transport_dtype: str = 'f32'  # Audio échangé avec les clients: 'f32' ou 'i16'
+    audio_core: Optional[int] = None  # Cœur CPU dédié au thread audio (None = libre)
+    
+    def __post_init__(self):
+        """Arrondir block_size au multiple de _BLOCK_SIZE_GRANULARITY inférieur"""
+        requested = int(self.block_size)
+        if requested < _BLOCK_SIZE_GRANULARITY:
+            raise ValueError(f"block_size invalide: {requested} (minimum {_BLOCK_SIZE_GRANULARITY})")
+        self.block_size = requested - requested % _BLOCK_SIZE_GRANULARITY
+        if self.block_size != requested:
+            logger.info(f"block_size {requested} arrondi à {self.block_size}")
+
+
+def _parse_transport_dtype(value: Any) -> str:
+    """Valider le format de transport de l'audio"""
+    value = str(value)
+    if value not in ('f32', 'i16'):
+        raise ValueError(f"transport_dtype invalide: {value}")
+    return value
+
+
+# Champs de ASIOConfig modifiables par SET_CONFIG, avec leur conversion
+_CONFIG_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    'sample_rate': int,
+    'block_size': int,
+    'input_channels': int,
+    'output_channels': int,
+    'transport_dtype': _parse_transport_dtype,
+}
+
+# Champs de ASIOConfig renvoyés aux clients (CONFIG et CONFIG_SET)
+_PUBLIC_CONFIG_FIELDS = ('device_name', 'sample_rate', 'block_size',
+                         'input_channels', 'output_channels', 'transport_dtype')
+
+# Champs de ASIOConfig qui définissent le flux ouvert sur le périphérique
+# (les autres, comme transport_dtype, ne concernent que les clients)
+_STREAM_CONFIG_FIELDS = ('device_name', 'sample_rate', 'block_size',
+                         'input_channels', 'output_channels', 'audio_core')
+
+
+def _stream_fingerprint(config: 'ASIOConfig') -> Tuple[Any, ...]:
+    """Valeurs de la config qui imposent de rouvrir le périphérique si elles changent"""
+    return tuple(getattr(config, name) for name in _STREAM_CONFIG_FIELDS)
 
 
 @dataclass
@@ -91,6 +275,55 @@ class AudioStreamState:
     latency_ms: float = 0.0
     buffer_underruns: int = 0
     buffer_overruns: int = 0
+    blocks_processed: int = 0  # Blocs d'entrée du run en cours (perdus compris)
+
+
+class _GUID(ctypes.Structure):
+    """GUID COM (CLSID, IID)"""
+    _fields_ = [
+        ("Data1", ctypes.c_uint32),
+        ("Data2", ctypes.c_uint16),
+        ("Data3", ctypes.c_uint16),
+        ("Data4", ctypes.c_ubyte * 8)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_guid(clsid: str) -> _GUID:
+    """
+    Convertir un CLSID '{XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX}' en GUID
+    
+    Mémorisé par CLSID: le GUID retourné est partagé et ne doit pas être modifié.
+    """
+    # bytes_le: disposition mémoire d'un GUID Windows (Data1-3 little-endian)
+    guid = _GUID()
+    ctypes.memmove(ctypes.byref(guid), uuid.UUID(clsid).bytes_le, ctypes.sizeof(guid))
+    return guid
+
+
+# IID_IUnknown {00000000-0000-0000-C000-000000000046}
+_IID_IUNKNOWN = _parse_guid("{00000000-0000-0000-C000-000000000046}")
+
+# Méthodes de l'interface IASIO utilisées: nom -> (index vtable, prototype)
+if sys.platform == 'win32':
+    _ASIO_VTABLE_METHODS: Dict[str, Tuple[int, Any]] = {
+        'release': (2, ctypes.WINFUNCTYPE(ctypes.c_ulong, ctypes.c_void_p)),
+        'init': (3, ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p, ctypes.c_void_p)),
+        'get_channels': (9, ctypes.WINFUNCTYPE(
+            ctypes.c_long,
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_long),
+            ctypes.POINTER(ctypes.c_long)
+        )),
+        'get_sample_rate': (13, ctypes.WINFUNCTYPE(
+            ctypes.c_long,
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_double)
+        )),
+        'control_panel': (21, ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p)),
+    }
+else:
+    _ASIO_VTABLE_METHODS = {}
 
 
 class ASIODriverInstance:
@@ -106,6 +339,7 @@ class ASIODriverInstance:
         self.clsid: Optional[str] = None
         self.p_driver: Optional[Any] = None  # Pointeur COM vers le driver
         self.vtable_ptr: Optional[Any] = None
+        self._asio: Dict[str, Callable[..., int]] = {}  # Méthodes IASIO liées au driver
         self.is_loaded: bool = False
         self.is_initialized: bool = False
         self._ole32 = None
@@ -139,40 +373,11 @@ class ASIODriverInstance:
             logger.info(f"   CLSID: {clsid}")
             
             try:
-                import ctypes
-                from ctypes import wintypes
-                
                 self._ole32 = ctypes.windll.ole32
                 self._ole32.CoInitialize(None)
                 
-                # Structures GUID
-                class GUID(ctypes.Structure):
-                    _fields_ = [
-                        ("Data1", wintypes.DWORD),
-                        ("Data2", wintypes.WORD),
-                        ("Data3", wintypes.WORD),
-                        ("Data4", wintypes.BYTE * 8)
-                    ]
-                
-                # Parser le CLSID
-                clsid_clean = clsid.strip('{}')
-                parts = clsid_clean.split('-')
-                guid = GUID()
-                guid.Data1 = int(parts[0], 16)
-                guid.Data2 = int(parts[1], 16)
-                guid.Data3 = int(parts[2], 16)
-                data4_hex = parts[3] + parts[4]
-                for i in range(8):
-                    guid.Data4[i] = int(data4_hex[i*2:i*2+2], 16)
-                
-                # IID_IUnknown
-                IID_IUnknown = GUID()
-                IID_IUnknown.Data1 = 0x00000000
-                IID_IUnknown.Data2 = 0x0000
-                IID_IUnknown.Data3 = 0x0000
-                IID_IUnknown.Data4[0] = 0xC0
-                IID_IUnknown.Data4[1] = 0x00
-                IID_IUnknown.Data4[7] = 0x46
+                # CLSID analysé une seule fois par driver (voir _parse_guid)
+                guid = _parse_guid(clsid)
                 
                 # Créer l'instance COM
                 p_driver = ctypes.c_void_p()
@@ -180,7 +385,7 @@ class ASIODriverInstance:
                     ctypes.byref(guid),
                     None,
                     1,  # CLSCTX_INPROC_SERVER
-                    ctypes.byref(IID_IUnknown),
+                    ctypes.byref(_IID_IUNKNOWN),
                     ctypes.byref(p_driver)
                 )
                 
@@ -195,10 +400,14 @@ class ASIODriverInstance:
                 vtable = ctypes.cast(p_driver, ctypes.POINTER(ctypes.c_void_p))[0]
                 self.vtable_ptr = ctypes.cast(vtable, ctypes.POINTER(ctypes.c_void_p * 24))[0]
                 
+                # Lier une fois les méthodes IASIO aux entrées de la vtable
+                self._asio = {
+                    name: prototype(self.vtable_ptr[index])
+                    for name, (index, prototype) in _ASIO_VTABLE_METHODS.items()
+                }
+                
                 # Initialiser le driver ASIO
-                ASIO_INIT_FUNC = ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p, ctypes.c_void_p)
-                init_func = ASIO_INIT_FUNC(self.vtable_ptr[3])
-                init_result = init_func(p_driver.value, None)
+                init_result = self._asio['init'](p_driver.value, None)
                 
                 logger.info(f"   ASIO init() result: {init_result}")
                 
@@ -230,42 +439,25 @@ class ASIODriverInstance:
                 return False
     
     def _find_driver_clsid(self, driver_name: str) -> Optional[str]:
-        """Trouver le CLSID d'un driver dans le registre"""
+        """Trouver le CLSID d'un driver dans le registre (scan mis en cache)"""
         if not WINREG_AVAILABLE:
             return None
         
-        for reg_path in [r"SOFTWARE\ASIO", r"SOFTWARE\WOW6432Node\ASIO"]:
-            try:
-                asio_key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path, 0, winreg.KEY_READ)
-                try:
-                    driver_key = winreg.OpenKey(asio_key, driver_name)
-                    clsid, _ = winreg.QueryValueEx(driver_key, "CLSID")
-                    winreg.CloseKey(driver_key)
-                    winreg.CloseKey(asio_key)
-                    return clsid
-                except:
-                    pass
-                winreg.CloseKey(asio_key)
-            except:
-                continue
+        # Les noms de clés du registre ne sont pas sensibles à la casse
+        wanted = driver_name.lower()
+        for _, name, clsid, _ in _enumerate_asio_registry():
+            if clsid and name.lower() == wanted:
+                return clsid
         return None
     
     def _query_driver_info(self):
         """Récupérer les informations du driver chargé"""
-        if not self.p_driver or not self.vtable_ptr:
+        if not self.p_driver or not self._asio:
             return
         
         try:
-            import ctypes
-            
-            # getChannels() - index 9
-            GET_CHANNELS_FUNC = ctypes.WINFUNCTYPE(
-                ctypes.c_long, 
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_long),
-                ctypes.POINTER(ctypes.c_long)
-            )
-            get_channels = GET_CHANNELS_FUNC(self.vtable_ptr[9])
+            # getChannels()
+            get_channels = self._asio['get_channels']
             
             num_inputs = ctypes.c_long()
             num_outputs = ctypes.c_long()
@@ -275,13 +467,8 @@ class ASIODriverInstance:
                 self.input_channels = num_inputs.value
                 self.output_channels = num_outputs.value
             
-            # getSampleRate() - index 13
-            GET_SAMPLERATE_FUNC = ctypes.WINFUNCTYPE(
-                ctypes.c_long,
-                ctypes.c_void_p,
-                ctypes.POINTER(ctypes.c_double)
-            )
-            get_samplerate = GET_SAMPLERATE_FUNC(self.vtable_ptr[13])
+            # getSampleRate()
+            get_samplerate = self._asio['get_sample_rate']
             
             sample_rate = ctypes.c_double()
             result = get_samplerate(self.p_driver.value, ctypes.byref(sample_rate))
@@ -299,12 +486,7 @@ class ASIODriverInstance:
             return False
         
         try:
-            import ctypes
-            
-            # controlPanel() - index 21
-            CTRL_FUNC = ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p)
-            control_panel = CTRL_FUNC(self.vtable_ptr[21])
-            result = control_panel(self.p_driver.value)
+            result = self._asio['control_panel'](self.p_driver.value)
             
             logger.info(f"   controlPanel() result: {result}")
             return True
@@ -326,13 +508,9 @@ class ASIODriverInstance:
         logger.info(f"🔌 Déchargement du driver ASIO: {self.driver_name}")
         
         try:
-            if self.p_driver and self.vtable_ptr:
-                import ctypes
-                
-                # Release() - index 2
-                RELEASE_FUNC = ctypes.WINFUNCTYPE(ctypes.c_ulong, ctypes.c_void_p)
-                release = RELEASE_FUNC(self.vtable_ptr[2])
-                release(self.p_driver.value)
+            if self.p_driver and self._asio:
+                # Release()
+                self._asio['release'](self.p_driver.value)
             
             if self._ole32:
                 self._ole32.CoUninitialize()
@@ -342,6 +520,7 @@ class ASIODriverInstance:
         
         self.p_driver = None
         self.vtable_ptr = None
+        self._asio = {}
         self.driver_name = None
         self.clsid = None
         self.is_loaded = False
@@ -362,6 +541,67 @@ class ASIODriverInstance:
         }
 
 
+# Clés du registre des drivers ASIO: d'abord la clé 64-bit, puis 32-bit
+_ASIO_REGISTRY_PATHS = (r"SOFTWARE\ASIO", r"SOFTWARE\WOW6432Node\ASIO")
+
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_asio_registry() -> Tuple[Tuple[int, str, Optional[str], Optional[str]], ...]:
+    """
+    Lire les drivers ASIO du registre: tuples (index, nom, CLSID, description)
+    
+    Le résultat est gardé pour la durée du processus; ASIODeviceManager.rescan()
+    le vide avec cache_clear().
+    """
+    drivers = []
+    seen = set()
+    open_key, enum_key, query_value = winreg.OpenKey, winreg.EnumKey, winreg.QueryValueEx
+    
+    for path in _ASIO_REGISTRY_PATHS:
+        try:
+            asio_key = open_key(winreg.HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ)
+        except FileNotFoundError:
+            # Cette clé n'existe pas
+            continue
+        except PermissionError:
+            logger.warning(f"Permission refusée pour accéder à {path}")
+            continue
+        
+        with asio_key:
+            # Nombre de sous-clés connu d'avance (chaque sous-clé = un driver ASIO)
+            subkey_count = winreg.QueryInfoKey(asio_key)[0]
+            for i in range(subkey_count):
+                try:
+                    driver_name = enum_key(asio_key, i)
+                except OSError:
+                    # Clé modifiée pendant l'énumération
+                    break
+                
+                # Éviter les doublons entre les clés 64-bit et 32-bit
+                if driver_name in seen:
+                    continue
+                seen.add(driver_name)
+                
+                try:
+                    driver_key = open_key(asio_key, driver_name)
+                except OSError:
+                    continue
+                
+                with driver_key:
+                    try:
+                        clsid = query_value(driver_key, "CLSID")[0]
+                    except OSError:
+                        clsid = None
+                    try:
+                        description = query_value(driver_key, "Description")[0]
+                    except OSError:
+                        description = driver_name
+                
+                drivers.append((i, driver_name, clsid, description))
+    
+    return tuple(drivers)
+
+
 class ASIODeviceManager:
     """
     Gestionnaire des périphériques audio ASIO
@@ -373,8 +613,21 @@ class ASIODeviceManager:
         self.devices: List[Dict[str, Any]] = []
         self.asio_drivers: List[Dict[str, Any]] = []
         self.current_device: Optional[str] = None
+        self._scan_lock = threading.Lock()
+        self._scan_all()
+    
+    def _scan_all(self):
+        """
+        Scanner le registre puis sounddevice, et croiser les résultats
+        
+        Chaque scan publie sa liste d'un bloc, le croisement se fait une
+        fois les deux terminés.
+        """
         self._scan_asio_registry()
         self._scan_sounddevice_devices()
+        
+        self._link_asio_drivers()
+        self._build_caches()
     
     def _scan_asio_registry(self):
         """
@@ -382,78 +635,33 @@ class ASIODeviceManager:
         
         Les drivers ASIO sont enregistrés dans:
         HKEY_LOCAL_MACHINE\SOFTWARE\ASIO
+        
+        La liste est construite localement puis publiée d'un bloc, pour que
+        les lecteurs ne voient jamais un scan partiel.
         """
-        self.asio_drivers = []
+        asio_drivers = []
         
         if not WINREG_AVAILABLE:
+            self.asio_drivers = asio_drivers
             logger.warning("winreg non disponible - impossible de lire le registre ASIO")
             return
         
         try:
-            # Ouvrir la clé ASIO dans le registre
-            # Essayer d'abord la clé 64-bit, puis 32-bit
-            asio_key_paths = [
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\ASIO"),
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\ASIO"),
-            ]
-            
-            for hkey, path in asio_key_paths:
-                try:
-                    asio_key = winreg.OpenKey(hkey, path, 0, winreg.KEY_READ)
-                    
-                    # Énumérer les sous-clés (chaque sous-clé = un driver ASIO)
-                    i = 0
-                    while True:
-                        try:
-                            driver_name = winreg.EnumKey(asio_key, i)
-                            
-                            # Ouvrir la sous-clé du driver
-                            driver_key = winreg.OpenKey(asio_key, driver_name)
-                            
-                            # Lire les informations du driver
-                            try:
-                                clsid, _ = winreg.QueryValueEx(driver_key, "CLSID")
-                            except:
-                                clsid = None
-                            
-                            try:
-                                description, _ = winreg.QueryValueEx(driver_key, "Description")
-                            except:
-                                description = driver_name
-                            
-                            driver_info = {
-                                'id': i,
-                                'name': driver_name,
-                                'description': description or driver_name,
-                                'clsid': clsid,
-                                'is_asio': True,
-                                'max_input_channels': 2,  # Par défaut, sera mis à jour
-                                'max_output_channels': 2,
-                                'default_sample_rate': 44100,
-                                'hostapi': 'ASIO'
-                            }
-                            
-                            # Éviter les doublons
-                            if not any(d['name'] == driver_name for d in self.asio_drivers):
-                                self.asio_drivers.append(driver_info)
-                                logger.info(f"🎛️ ASIO Driver trouvé: {driver_name}")
-                            
-                            winreg.CloseKey(driver_key)
-                            i += 1
-                            
-                        except OSError:
-                            # Plus de sous-clés
-                            break
-                    
-                    winreg.CloseKey(asio_key)
-                    
-                except FileNotFoundError:
-                    # Cette clé n'existe pas
-                    continue
-                except PermissionError:
-                    logger.warning(f"Permission refusée pour accéder à {path}")
-                    continue
+            for i, driver_name, clsid, description in _enumerate_asio_registry():
+                asio_drivers.append({
+                    'id': i,
+                    'name': driver_name,
+                    'description': description or driver_name,
+                    'clsid': clsid,
+                    'is_asio': True,
+                    'max_input_channels': 2,  # Par défaut, sera mis à jour
+                    'max_output_channels': 2,
+                    'default_sample_rate': 44100,
+                    'hostapi': 'ASIO'
+                })
+                logger.info(f"🎛️ ASIO Driver trouvé: {driver_name}")
             
+            self.asio_drivers = asio_drivers
             logger.info(f"📊 {len(self.asio_drivers)} drivers ASIO trouvés dans le registre")
             
         except Exception as e:
@@ -465,7 +673,7 @@ class ASIODeviceManager:
             logger.warning("sounddevice non disponible")
             return
         
-        self.devices = []
+        scanned_devices = []
         
         try:
             # Lister tous les périphériques
@@ -492,25 +700,34 @@ class ASIODeviceManager:
                     'hostapi': hostapis[device['hostapi']]['name'],
                     'is_asio': is_asio
                 }
-                self.devices.append(device_info)
+                scanned_devices.append(device_info)
                 
                 if is_asio:
                     logger.info(f"🎛️ ASIO Device (sounddevice): {device['name']}")
-                    
-                    # Mettre à jour les infos du driver ASIO correspondant
-                    for asio_driver in self.asio_drivers:
-                        if asio_driver['name'].lower() in device['name'].lower() or \
-                           device['name'].lower() in asio_driver['name'].lower():
-                            asio_driver['max_input_channels'] = device['max_input_channels']
-                            asio_driver['max_output_channels'] = device['max_output_channels']
-                            asio_driver['default_sample_rate'] = device['default_samplerate']
-                            asio_driver['sounddevice_id'] = i
             
+            self.devices = scanned_devices
             logger.info(f"📊 {len(self.devices)} périphériques audio trouvés via sounddevice")
             
         except Exception as e:
             logger.error(f"Erreur lors du scan sounddevice: {e}")
     
+    def _link_asio_drivers(self):
+        """Compléter les drivers du registre avec les infos du device sounddevice correspondant"""
+        # Noms des drivers du registre, mis en minuscules une seule fois
+        asio_names = [(d['name'].lower(), d) for d in self.asio_drivers]
+        
+        for device in self.devices:
+            if not device['is_asio']:
+                continue
+            
+            device_lower = device['name'].lower()
+            for asio_lower, asio_driver in asio_names:
+                if asio_lower in device_lower or device_lower in asio_lower:
+                    asio_driver['max_input_channels'] = device['max_input_channels']
+                    asio_driver['max_output_channels'] = device['max_output_channels']
+                    asio_driver['default_sample_rate'] = device['default_sample_rate']
+                    asio_driver['sounddevice_id'] = device['id']
+    
     def _scan_pyaudio_devices(self):
         """Scanner les périphériques via PyAudio (alternative)"""
         if not PYAUDIO_AVAILABLE:
@@ -548,40 +765,90 @@ class ASIODeviceManager:
         Récupérer uniquement les périphériques ASIO
         
         Combine les drivers du registre et ceux détectés par sounddevice
+        (liste calculée une fois par scan)
         """
+        return self._asio_devices
+    
+    def get_devices_message(self) -> str:
+        """Message DEVICES sérialisé (calculé au plus une fois par scan)"""
+        message = self._devices_message
+        if message is None:
+            message = self._devices_message = _json_dumps({
+                "action": "DEVICES",
+                "devices": self.devices,
+                "asio_devices": self._asio_devices
+            })
+        return message
+    
+    def _merge_asio_devices(self) -> List[Dict[str, Any]]:
+        """Fusionner les drivers du registre et les devices ASIO de sounddevice"""
         # Commencer par les drivers ASIO du registre
         asio_devices = list(self.asio_drivers)
+        known_names = [asio['name'].lower() for asio in asio_devices]
         
         # Ajouter les devices ASIO détectés par sounddevice qui ne sont pas déjà dans la liste
         for device in self.devices:
             if device.get('is_asio'):
                 # Vérifier si ce device n'est pas déjà dans la liste
                 device_name_lower = device['name'].lower()
-                already_exists = False
-                
-                for asio in asio_devices:
-                    if asio['name'].lower() in device_name_lower or \
-                       device_name_lower in asio['name'].lower():
-                        already_exists = True
-                        break
+                already_exists = any(
+                    known in device_name_lower or device_name_lower in known
+                    for known in known_names
+                )
                 
                 if not already_exists:
                     asio_devices.append(device)
+                    known_names.append(device_name_lower)
         
         return asio_devices
     
+    def _build_caches(self):
+        """Recalculer les résultats mis en cache après un scan"""
+        self._asio_devices = self._merge_asio_devices()
+        self._device_by_name: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._devices_message: Optional[str] = None
+        
+        # Noms en minuscules calculés une fois par scan
+        self._asio_names = [(d['name'].lower(), d) for d in self.asio_drivers]
+        self._device_names = [(d['name'].lower(), d) for d in self.devices]
+        
+        # Noms des drivers ASIO (ceux demandés par SET_CONFIG) résolus d'avance,
+        # avec la même recherche qu'à la demande
+        for lower, _ in self._asio_names:
+            if lower not in self._device_by_name:
+                self._device_by_name[lower] = self._find_device(lower)
+    
     def get_device_by_name(self, name: str) -> Optional[Dict[str, Any]]:
-        """Trouver un périphérique par son nom"""
+        """
+        Trouver un périphérique par son nom (résultat mis en cache par scan)
+        
+        Recherche par inclusion, drivers ASIO d'abord, puis tous les devices.
+        """
+        name_lower = name.lower()
+        cache = self._device_by_name
+        if name_lower in cache:
+            return cache[name_lower]
+        
+        found = cache[name_lower] = self._find_device(name_lower)
+        return found
+    
+    def _find_device(self, name_lower: str) -> Optional[Dict[str, Any]]:
+        """Recherche sans cache d'un nom déjà en minuscules"""
+        found = None
+        
         # Chercher d'abord dans les ASIO drivers
-        for driver in self.asio_drivers:
-            if name.lower() in driver['name'].lower() or driver['name'].lower() in name.lower():
-                return driver
+        for driver_lower, driver in self._asio_names:
+            if name_lower in driver_lower or driver_lower in name_lower:
+                found = driver
+                break
+        else:
+            # Puis dans tous les devices
+            for device_lower, device in self._device_names:
+                if name_lower in device_lower:
+                    found = device
+                    break
         
-        # Puis dans tous les devices
-        for device in self.devices:
-            if name.lower() in device['name'].lower():
-                return device
-        return None
+        return found
     
     def get_default_device(self) -> Optional[Dict[str, Any]]:
         """Récupérer le périphérique par défaut"""
@@ -600,10 +867,310 @@ class ASIODeviceManager:
             return None
     
     def rescan(self):
-        """Rescanner tous les périphériques"""
-        logger.info("🔄 Rescanning audio devices...")
-        self._scan_asio_registry()
-        self._scan_sounddevice_devices()
+        """
+        Rescanner tous les périphériques
+        
+        Bloquant (appels PortAudio et registre): à exécuter hors de la
+        boucle asyncio.
+        """
+        with self._scan_lock:
+            logger.info("🔄 Rescanning audio devices...")
+            if WINREG_AVAILABLE:
+                _enumerate_asio_registry.cache_clear()
+            self._scan_all()
+
+
+class AudioRingBuffer:
+    """
+    Buffer circulaire SPSC pré-alloué d'échantillons float32
+    
+    Un seul producteur et un seul consommateur. Les données sont copiées
+    directement dans un tableau numpy (frames, channels) alloué une fois:
+    aucune allocation par bloc et aucun verrou. Chaque index n'est écrit
+    que par un seul côté (write_idx par le producteur, read_idx par le
+    consommateur) et publié après la copie des données; la lecture et
+    l'affectation d'un int sont atomiques sous le GIL de CPython.
+    
+    La capacité est arrondie à la puissance de deux supérieure: le
+    repliement des index est un masque binaire plutôt qu'un modulo.
+    """
+    
+    def __init__(self, capacity: int, channels: int):
+        capacity = 1 << (max(1, capacity) - 1).bit_length()
+        self.capacity = capacity
+        self.channels = channels
+        self.buffer = np.zeros((capacity, channels), dtype=np.float32)
+        self._mask = capacity - 1
+        
+        # Index absolus en frames (le masque est appliqué à l'accès)
+        self._write_idx = 0
+        self._read_idx = 0
+    
+    def write(self, data: np.ndarray) -> bool:
+        """Écrire un bloc (frames, channels) dans le buffer"""
+        frames = data.shape[0]
+        w = self._write_idx
+        if frames > self.capacity - (w - self._read_idx):
+            return False  # Buffer plein
+        
+        # Adapter le nombre de canaux (les canaux manquants restent à zéro)
+        channels = min(data.shape[1] if data.ndim > 1 else 1, self.channels)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        
+        start = w & self._mask
+        first = min(frames, self.capacity - start)
+        for dst, src in ((self.buffer[start:start + first], data[:first]),
+                         (self.buffer[:frames - first], data[first:])):
+            np.copyto(dst[:, :channels], src[:, :channels])
+            if channels < self.channels:
+                dst[:, channels:] = 0
+        
+        # Publier après la copie
+        self._write_idx = w + frames
+        return True
+    
+    def read_into(self, out: np.ndarray) -> bool:
+        """Lire exactement len(out) frames dans out"""
+        frames = out.shape[0]
+        r = self._read_idx
+        if self._write_idx - r < frames:
+            return False  # Pas assez de données
+        
+        start = r & self._mask
+        first = min(frames, self.capacity - start)
+        np.copyto(out[:first], self.buffer[start:start + first])
+        if first < frames:
+            np.copyto(out[first:], self.buffer[:frames - first])
+        
+        # Libérer l'espace après la copie
+        self._read_idx = r + frames
+        return True
+    
+    def read_available_into(self, out: np.ndarray) -> int:
+        """
+        Lire jusqu'à len(out) frames dans out
+        
+        Retourne le nombre de frames copiées au début de out (le reste de
+        out n'est pas modifié).
+        """
+        r = self._read_idx
+        frames = min(out.shape[0], self._write_idx - r)
+        if frames <= 0:
+            return 0
+        
+        start = r & self._mask
+        first = min(frames, self.capacity - start)
+        np.copyto(out[:first], self.buffer[start:start + first])
+        if first < frames:
+            np.copyto(out[first:frames], self.buffer[:frames - first])
+        
+        # Libérer l'espace après la copie
+        self._read_idx = r + frames
+        return frames
+    
+    def view(self, start: int, frames: int) -> Optional[np.ndarray]:
+        """
+        Vue sans copie sur frames déjà écrites à partir de l'index absolu start
+        
+        Retourne None si la zone fait le tour du buffer (non contiguë).
+        """
+        offset = start & self._mask
+        if offset + frames > self.capacity:
+            return None
+        return self.buffer[offset:offset + frames]
+    
+    def consume(self, frames: int):
+        """Libérer frames déjà lues sur place, via view() (côté consommateur)"""
+        self._read_idx += frames
+    
+    @property
+    def write_index(self) -> int:
+        """Index absolu de la prochaine écriture (côté producteur)"""
+        return self._write_idx
+    
+    def read(self, frames: int) -> Optional[np.ndarray]:
+        """Lire un bloc de frames (alloué côté consommateur)"""
+        out = np.empty((frames, self.channels), dtype=np.float32)
+        if self.read_into(out):
+            return out
+        return None
+    
+    def available(self) -> int:
+        """Nombre de frames disponibles en lecture"""
+        return self._write_idx - self._read_idx
+    
+    def clear(self):
+        """Vider le buffer (côté consommateur)"""
+        self._read_idx = self._write_idx
+
+
+# Constantes Win32 de priorité des threads
+_THREAD_PRIORITY_TIME_CRITICAL = 15
+_THREAD_SET_INFORMATION = 0x0020
+_THREAD_QUERY_INFORMATION = 0x0040
+_AVRT_PRIORITY_CRITICAL = 2
+
+# Causes d'échec déjà signalées: un avertissement par processus, pas par
+# redémarrage du flux
+_REPORTED_BOOST_FAILURES: set = set()
+
+
+class _AudioThreadBoost:
+    """
+    Priorité temps réel du thread audio de PortAudio (et affinité sur un cœur)
+    
+    Les fonctions système (ctypes, avrt.dll) sont résolues une fois à la
+    construction, hors du thread audio: apply(), appelé depuis le callback,
+    ne fait plus que les appels système. Ses échecs sont mis en file et
+    journalisés par report(), appelé hors du thread audio.
+    
+    Le thread appartient à PortAudio (au driver sous ASIO) et peut lui
+    survivre: revert() restaure son état d'origine à l'arrêt du flux.
+    """
+    
+    def __init__(self, core: Optional[int]):
+        self.core = core
+        self._failures: queue.SimpleQueue = queue.SimpleQueue()
+        self._applied: List[Tuple[Any, ...]] = []  # État d'origine de chaque thread priorisé
+        self._kernel32 = None
+        self._avrt = None
+        if sys.platform == 'win32':
+            self._resolve_windows()
+    
+    def _resolve_windows(self):
+        """Charger et typer les fonctions Win32 utilisées par apply()"""
+        from ctypes import wintypes
+        
+        # Instances privées: les argtypes ne touchent pas ctypes.windll partagé
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+        kernel32.OpenThread.restype = wintypes.HANDLE
+        kernel32.OpenThread.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.GetThreadPriority.argtypes = [wintypes.HANDLE]
+        kernel32.SetThreadPriority.argtypes = [wintypes.HANDLE, ctypes.c_int]
+        kernel32.SetThreadAffinityMask.restype = ctypes.c_size_t
+        kernel32.SetThreadAffinityMask.argtypes = [wintypes.HANDLE, ctypes.c_size_t]
+        self._kernel32 = kernel32
+        
+        # MMCSS "Pro Audio": classe du planificateur réservée à l'audio basse latence
+        try:
+            avrt = ctypes.WinDLL('avrt', use_last_error=True)
+            avrt.AvSetMmThreadCharacteristicsW.restype = wintypes.HANDLE
+            avrt.AvSetMmThreadCharacteristicsW.argtypes = [wintypes.LPCWSTR, ctypes.POINTER(wintypes.DWORD)]
+            avrt.AvSetMmThreadPriority.argtypes = [wintypes.HANDLE, ctypes.c_int]
+            avrt.AvRevertMmThreadCharacteristics.argtypes = [wintypes.HANDLE]
+            self._avrt = avrt
+            self._task_index = wintypes.DWORD(0)
+        except OSError as e:
+            self._failures.put(('mmcss', e))
+    
+    def apply(self) -> bool:
+        """
+        Prioriser le thread courant (thread audio: appels système uniquement)
+        
+        Retourne False si un réglage a échoué (voir report()).
+        """
+        if self._kernel32 is not None:
+            self._apply_windows()
+        elif hasattr(os, 'sched_setaffinity'):
+            self._apply_posix()
+        return self._failures.empty()
+    
+    def _apply_windows(self):
+        kernel32 = self._kernel32
+        
+        # Vrai handle (pas le pseudo-handle de GetCurrentThread): revert() est
+        # appelé depuis un autre thread
+        thread = kernel32.OpenThread(_THREAD_SET_INFORMATION | _THREAD_QUERY_INFORMATION,
+                                     False, kernel32.GetCurrentThreadId())
+        if not thread:
+            self._failures.put(('thread', ctypes.WinError(ctypes.get_last_error())))
+            return
+        
+        mmcss = None
+        if self._avrt is not None:
+            mmcss = self._avrt.AvSetMmThreadCharacteristicsW("Pro Audio", ctypes.byref(self._task_index))
+            if mmcss:
+                # Priorité dans la plage temps réel gérée par MMCSS
+                self._avrt.AvSetMmThreadPriority(mmcss, _AVRT_PRIORITY_CRITICAL)
+            else:
+                self._failures.put(('mmcss', ctypes.WinError(ctypes.get_last_error())))
+        
+        # Sans MMCSS seulement: SetThreadPriority écraserait sa priorité
+        old_priority = None
+        if not mmcss:
+            old_priority = kernel32.GetThreadPriority(thread)
+            kernel32.SetThreadPriority(thread, _THREAD_PRIORITY_TIME_CRITICAL)
+        
+        old_mask = 0
+        if self.core is not None:
+            old_mask = kernel32.SetThreadAffinityMask(thread, 1 << self.core)
+        
+        self._applied.append((thread, mmcss, old_priority, old_mask))
+    
+    def _apply_posix(self):
+        old_affinity = None
+        try:
+            if self.core is not None:
+                old_affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {self.core})
+        except OSError as e:
+            self._failures.put(('affinity', e))
+        
+        old_scheduler = None
+        try:
+            # SCHED_FIFO nécessite des privilèges (CAP_SYS_NICE)
+            scheduler = (os.sched_getscheduler(0), os.sched_getparam(0))
+            priority = os.sched_get_priority_min(os.SCHED_FIFO)
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            old_scheduler = scheduler
+        except OSError as e:
+            self._failures.put(('sched_fifo', e))
+        
+        self._applied.append((threading.get_native_id(), old_affinity, old_scheduler))
+    
+    def revert(self):
+        """Restaurer les threads priorisés par apply() (flux arrêté, hors du thread audio)"""
+        applied, self._applied = self._applied, []
+        for state in applied:
+            try:
+                if self._kernel32 is not None:
+                    self._revert_windows(*state)
+                else:
+                    self._revert_posix(*state)
+            except OSError as e:
+                # Thread déjà terminé (PortAudio en crée un par démarrage)
+                logger.debug(f"Thread audio non restauré: {e}")
+        self.report()
+    
+    def _revert_windows(self, thread, mmcss, old_priority, old_mask):
+        kernel32 = self._kernel32
+        try:
+            if old_mask:
+                kernel32.SetThreadAffinityMask(thread, old_mask)
+            if old_priority is not None:
+                kernel32.SetThreadPriority(thread, old_priority)
+            if mmcss:
+                self._avrt.AvRevertMmThreadCharacteristics(mmcss)
+        finally:
+            kernel32.CloseHandle(thread)
+    
+    def _revert_posix(self, tid, old_affinity, old_scheduler):
+        if old_affinity is not None:
+            os.sched_setaffinity(tid, old_affinity)
+        if old_scheduler is not None:
+            os.sched_setscheduler(tid, *old_scheduler)
+    
+    def report(self):
+        """Journaliser les échecs de apply() (hors du thread audio, une fois par cause)"""
+        failures = self._failures
+        while not failures.empty():
+            key, error = failures.get_nowait()
+            if key not in _REPORTED_BOOST_FAILURES:
+                _REPORTED_BOOST_FAILURES.add(key)
+                logger.warning(f"Priorité temps réel du thread audio non appliquée ({key}): {error}")
 
 
 class ASIOAudioStream:
@@ -613,87 +1180,152 @@ class ASIOAudioStream:
     Gère l'entrée et la sortie audio en temps réel avec ASIO
     """
     
-    def __init__(self, config: ASIOConfig, on_input_callback: Optional[Callable] = None):
+    def __init__(self, config: ASIOConfig, on_input_callback: Optional[Callable] = None,
+                 device_manager: Optional[ASIODeviceManager] = None):
+        """
+        Args:
+            config: Configuration ASIO
+            on_input_callback: Appelé depuis un thread dédié (hors du thread
+                audio) avec chaque bloc d'entrée. Le bloc est une vue en lecture
+                seule, sans copie, sur le buffer circulaire: il doit être
+                consommé ou copié avant de rendre la main. Ce thread est alors
+                le consommateur du buffer d'entrée (read_input() et
+                read_input_batch() ne doivent pas être utilisés en plus).
+            device_manager: Gestionnaire déjà scanné pour résoudre le
+                périphérique (évite un nouveau scan au démarrage)
+        """
         self.config = config
         self.on_input_callback = on_input_callback
+        self.device_manager = device_manager
         
         # État
         self.state = AudioStreamState()
         self.stream: Optional[sd.Stream] = None
         
-        # Buffers circulaires pour l'audio
-        self.input_buffer: deque = deque(maxlen=100)  # ~100 blocs d'entrée
-        self.output_buffer: deque = deque(maxlen=100)  # ~100 blocs de sortie
+        # Buffers circulaires pré-alloués pour l'audio (~100 blocs chacun)
+        self._in_ring = AudioRingBuffer(128 * config.block_size, config.input_channels)
+        self._out_ring = AudioRingBuffer(128 * config.block_size, config.output_channels)
         
-        # Verrous pour thread-safety
-        self._lock = threading.Lock()
+        # Mesures par canal (crête, somme des carrés, écrêtages), réécrites
+        # par le callback à chaque bloc
+        self._in_meter = _new_meter(config.input_channels)
+        self._out_meter = _new_meter(config.output_channels)
         
-        # Statistiques
-        self.stats = {
-            'blocks_in': 0,
-            'blocks_out': 0,
-            'total_samples': 0,
-            'start_time': 0
-        }
+        # Tampon de lecture groupée pré-alloué (16 blocs), réutilisé à chaque lot
+        self._batch_buffer = np.empty((16 * config.block_size, config.input_channels), dtype=np.float32)
+        
+        # Réveil de la boucle asyncio quand de l'entrée arrive (voir bind_event_loop)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._input_ready: Optional[asyncio.Event] = None
+        self._input_signaled = False
+        
+        # Blocs d'entrée (index de départ, taille) à remettre au callback
+        # utilisateur par un thread dédié (voir _run_input_callback)
+        self._user_cb_queue = queue.SimpleQueue() if on_input_callback is not None else None
+        self._user_cb_thread: Optional[threading.Thread] = None
+        
+        # Statistiques: début du run en cours (remis à zéro par start(), avec
+        # state.blocks_processed)
+        self._start_ns = 0
+        
+        # Horloge monotone rafraîchie à chaque réveil de la boucle de diffusion
+        # (voir wait_input), lue par get_stats sans nouvel appel d'horloge
+        self._tick_ns = 0
+        
+        # Priorité du thread audio, préparée par prepare()
+        self._boost: Optional[_AudioThreadBoost] = None
     
-    def _audio_callback(self, indata: np.ndarray, outdata: np.ndarray, 
-                        frames: int, time_info: Any, status: sd.CallbackFlags):
+    def _make_audio_callback(self) -> Callable:
         """
-        Callback audio ASIO
+        Construire le callback audio spécialisé pour le flux courant
         
-        Appelé par sounddevice pour chaque bloc audio
+        Les buffers, l'état et la boucle asyncio sont liés une seule fois
+        dans la closure: le callback temps réel n'effectue plus de recherche
+        d'attribut sur self à chaque bloc.
         """
-        if status:
-            if status.input_overflow:
-                self.state.buffer_overruns += 1
-                logger.warning("Input overflow!")
-            if status.output_underflow:
-                self.state.buffer_underruns += 1
-                logger.warning("Output underflow!")
-        
-        # Calculer le niveau d'entrée
-        if indata is not None:
-            self.state.input_level = float(np.max(np.abs(indata)))
+        stream = self
+        state = self.state
+        in_ring = self._in_ring
+        out_ring = self._out_ring
+        user_cb_put = self._user_cb_queue.put if self._user_cb_queue is not None else None
+        loop = self._loop
+        input_ready_set = self._input_ready.set if loop is not None else None
+        meter_block = _meter_block
+        in_peaks, in_sum_sq, in_clips = self._in_meter
+        out_peaks, out_sum_sq, out_clips = self._out_meter
+        get_ident = threading.get_ident
+        boost = self._boost
+        boosted_thread = None
+        
+        def audio_callback(indata: np.ndarray, outdata: np.ndarray,
+                           frames: int, time_info: Any, status: sd.CallbackFlags):
+            """
+            Callback audio ASIO
             
-            # Stocker l'entrée dans le buffer
-            with self._lock:
-                self.input_buffer.append(indata.copy())
-                self.stats['blocks_in'] += 1
+            Appelé par sounddevice pour chaque bloc audio
+            """
+            nonlocal boosted_thread
+            if get_ident() != boosted_thread:
+                # Premier bloc sur ce thread audio de PortAudio (nouveau
+                # thread à chaque redémarrage du flux)
+                boosted_thread = get_ident()
+                if boost is not None and not boost.apply() and loop is not None:
+                    # Échec journalisé par la boucle, pas par le thread audio
+                    loop.call_soon_threadsafe(boost.report)
             
-            # Callback pour envoyer au DAW web
-            if self.on_input_callback:
-                try:
-                    self.on_input_callback(indata.copy())
-                except Exception as e:
-                    logger.error(f"Input callback error: {e}")
-        
-        # Récupérer l'audio de sortie du buffer
-        with self._lock:
-            if len(self.output_buffer) > 0:
-                output_data = self.output_buffer.popleft()
-                # S'assurer que les dimensions correspondent
-                if output_data.shape == outdata.shape:
-                    outdata[:] = output_data
+            if status:
+                if status.input_overflow:
+                    state.buffer_overruns += 1
+                    logger.warning("Input overflow!")
+                if status.output_underflow:
+                    state.buffer_underruns += 1
+                    logger.warning("Output underflow!")
+            
+            # Calculer le niveau d'entrée (sauf pendant l'amorçage des buffers de
+            # sortie: indata n'y contient pas encore d'audio capturé)
+            if indata is not None and not (status and status.priming_output):
+                state.input_level = meter_block(indata, in_peaks, in_sum_sq, in_clips)
+                state.blocks_processed += 1
+                
+                # Copier l'entrée dans le buffer circulaire (sans allocation)
+                start = in_ring.write_index
+                written = in_ring.write(indata)
+                if written:
+                    # Signaler la boucle asyncio une seule fois par lot en attente
+                    if loop is not None and not stream._input_signaled:
+                        stream._input_signaled = True
+                        loop.call_soon_threadsafe(input_ready_set)
+                    
+                    # Callback utilisateur exécuté hors du thread audio
+                    if user_cb_put is not None:
+                        user_cb_put((start, frames))
                 else:
-                    # Ajuster si nécessaire
-                    outdata[:] = np.zeros_like(outdata)
-                    min_frames = min(output_data.shape[0], outdata.shape[0])
-                    min_channels = min(output_data.shape[1] if len(output_data.shape) > 1 else 1,
-                                      outdata.shape[1] if len(outdata.shape) > 1 else 1)
-                    outdata[:min_frames, :min_channels] = output_data[:min_frames, :min_channels]
-                self.stats['blocks_out'] += 1
-            else:
-                # Silence si pas de données
-                outdata.fill(0)
+                    # Buffer d'entrée plein: le bloc est perdu
+                    state.buffer_overruns += 1
+            
+            # Récupérer l'audio de sortie du buffer circulaire
+            played = out_ring.read_available_into(outdata)
+            if played < frames:
+                # Pas assez de données: jouer ce qui est là puis du silence,
+                # plutôt que de garder un bloc partiel qui décalerait la suite
+                outdata[played:].fill(0)
+                if played:
+                    state.buffer_underruns += 1
+            
+            # Calculer le niveau de sortie
+            state.output_level = meter_block(outdata, out_peaks, out_sum_sq, out_clips)
         
-        # Calculer le niveau de sortie
-        self.state.output_level = float(np.max(np.abs(outdata)))
-        self.stats['total_samples'] += frames
+        return audio_callback
     
-    def start(self) -> bool:
-        """Démarrer le flux audio"""
-        if self.state.is_running:
-            logger.warning("Stream already running")
+    def prepare(self) -> bool:
+        """
+        Ouvrir le périphérique et créer le flux, sans le démarrer
+        
+        Tout le travail lourd (résolution du périphérique, ouverture du
+        driver, allocation des buffers PortAudio) est fait ici: start() n'a
+        plus qu'à lancer le flux. Sans effet si le flux est déjà ouvert.
+        """
+        if self.stream is not None:
             return True
         
         if not SOUNDDEVICE_AVAILABLE:
@@ -701,10 +1333,14 @@ class ASIOAudioStream:
             return False
         
         try:
+            # Fonctions système de priorité résolues ici, pas dans le callback
+            if self._boost is None:
+                self._boost = _AudioThreadBoost(self.config.audio_core)
+            
             # Configurer le périphérique
             device = None
             if self.config.device_name:
-                device_manager = ASIODeviceManager()
+                device_manager = self.device_manager or ASIODeviceManager()
                 device_info = device_manager.get_device_by_name(self.config.device_name)
                 if device_info:
                     # Utiliser l'ID sounddevice si disponible
@@ -717,14 +1353,55 @@ class ASIOAudioStream:
                 blocksize=self.config.block_size,
                 dtype=np.float32,
                 channels=(self.config.input_channels, self.config.output_channels),
-                callback=self._audio_callback,
-                latency='low'  # Demander la latence la plus basse possible
+                callback=self._make_audio_callback(),
+                latency='low',  # Demander la latence la plus basse possible
+                # Remplir les buffers de sortie initiaux via le callback
+                # plutôt qu'avec du silence imposé par PortAudio
+                prime_output_buffers_using_stream_callback=True
             )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to open stream: {e}")
+            return False
+    
+    def start(self) -> bool:
+        """
+        Démarrer le flux audio
+        
+        Ouvre le flux si prepare() n'a pas été appelé. Un flux arrêté avec
+        stop(close=False) est redémarré tel quel, sans rouvrir le périphérique.
+        """
+        if self.state.is_running:
+            logger.warning("Stream already running")
+            return True
+        
+        if self.stream is None:
+            if not self.prepare():
+                return False
+        
+        # Chaque démarrage repart de buffers vides (flux neuf ou resté ouvert
+        # après un arrêt): le callback est arrêté, les deux côtés peuvent
+        # être vidés ici
+        self._in_ring.clear()
+        self._out_ring.clear()
+        self.state.blocks_processed = 0
+        
+        try:
+            # Thread du callback utilisateur, démarré avant le flux
+            if self._user_cb_queue is not None:
+                self._user_cb_thread = threading.Thread(
+                    target=self._run_input_callback,
+                    args=(self._user_cb_queue,),
+                    name="asio-input-callback",
+                    daemon=True
+                )
+                self._user_cb_thread.start()
             
             # Démarrer
             self.stream.start()
             self.state.is_running = True
-            self.stats['start_time'] = time.time()
+            self._start_ns = self._tick_ns = time.monotonic_ns()
             
             # Calculer la latence
             if self.stream.latency:
@@ -739,22 +1416,91 @@ class ASIOAudioStream:
             
         except Exception as e:
             logger.error(f"Failed to start stream: {e}")
+            self._stop_input_callback()
             return False
     
-    def stop(self):
-        """Arrêter le flux audio"""
+    def _run_input_callback(self, user_cb_queue: queue.SimpleQueue):
+        """Remettre les blocs d'entrée au callback utilisateur (thread dédié)"""
+        on_input = self.on_input_callback
+        ring = self._in_ring
+        view = ring.view
+        get = user_cb_queue.get
+        
+        while True:
+            item = get()
+            if item is None:
+                break
+            start, frames = item
+            block = view(start, frames)
+            if block is None:
+                # Bloc à cheval sur la fin du buffer: copie (cas rare)
+                block = ring.buffer.take(range(start, start + frames), axis=0, mode='wrap')
+            block.flags.writeable = False
+            try:
+                on_input(block)
+            except Exception as e:
+                logger.error(f"Input callback error: {e}")
+            
+            # Bloc remis: libérer sa place pour le thread audio
+            ring.consume(frames)
+    
+    def _stop_input_callback(self):
+        """Arrêter le thread du callback utilisateur"""
+        if self._user_cb_thread is not None:
+            self._user_cb_queue.put(None)
+            self._user_cb_thread.join(timeout=1.0)
+            self._user_cb_thread = None
+    
+    def stop(self, close: bool = True):
+        """
+        Arrêter le flux audio
+        
+        Args:
+            close: Fermer le périphérique. Avec False, le flux reste ouvert
+                et un start() ultérieur le relance sans le rouvrir.
+        """
         if self.stream:
             try:
                 self.stream.stop()
-                self.stream.close()
+                if close:
+                    self.stream.close()
             except Exception as e:
                 logger.error(f"Error stopping stream: {e}")
+                close = True
             
-            self.stream = None
+            if close:
+                self.stream = None
         
+        self._stop_input_callback()
         self.state.is_running = False
+        if self._boost is not None:
+            self._boost.revert()
+        
+        # Réveiller le consommateur en attente pour qu'il constate l'arrêt
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._input_ready.set)
         logger.info("🛑 Audio stream stopped")
     
+    def bind_event_loop(self, loop: asyncio.AbstractEventLoop):
+        """
+        Associer une boucle asyncio réveillée par le thread audio
+        
+        À appeler depuis la boucle elle-même, avant start().
+        """
+        self._loop = loop
+        self._input_ready = asyncio.Event()
+        self._input_signaled = False
+    
+    async def wait_input(self, timeout: float = 0.5):
+        """Attendre que de nouveaux blocs d'entrée soient disponibles"""
+        try:
+            await asyncio.wait_for(self._input_ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._input_ready.clear()
+        self._input_signaled = False
+        self._tick_ns = time.monotonic_ns()
+    
     def write_output(self, audio_data: np.ndarray):
         """
         Écrire des données audio vers la sortie
@@ -762,8 +1508,7 @@ class ASIOAudioStream:
         Args:
             audio_data: Array numpy avec les échantillons audio
         """
-        with self._lock:
-            self.output_buffer.append(audio_data)
+        self._out_ring.write(audio_data)
     
     def read_input(self) -> Optional[np.ndarray]:
         """
@@ -772,14 +1517,37 @@ class ASIOAudioStream:
         Returns:
             Array numpy avec les échantillons audio ou None
         """
-        with self._lock:
-            if len(self.input_buffer) > 0:
-                return self.input_buffer.popleft()
-        return None
+        return self._in_ring.read(self.config.block_size)
+    
+    def read_input_batch(self, max_blocks: int = 16) -> Optional[np.ndarray]:
+        """
+        Lire d'un coup tous les blocs d'entrée disponibles
+        
+        Args:
+            max_blocks: Nombre maximum de blocs regroupés
+        
+        Returns:
+            Vue (blocs * block_size, channels) sur le tampon pré-alloué,
+            valide jusqu'au prochain appel, ou None
+        """
+        block_size = self.config.block_size
+        max_blocks = min(max_blocks, len(self._batch_buffer) // block_size)
+        blocks = min(self._in_ring.available() // block_size, max_blocks)
+        if blocks == 0:
+            return None
+        
+        out = self._batch_buffer[:blocks * block_size]
+        if not self._in_ring.read_into(out):
+            return None
+        return out
     
     def get_stats(self) -> Dict[str, Any]:
-        """Récupérer les statistiques"""
-        elapsed = time.time() - self.stats['start_time'] if self.stats['start_time'] > 0 else 0
+        """Récupérer les statistiques (mesures par canal en tableaux numpy)"""
+        start_ns = self._start_ns
+        elapsed = (self._tick_ns - start_ns) * 1e-9 if start_ns else 0
+        in_peaks, in_sum_sq, in_clips = self._in_meter
+        out_peaks, out_sum_sq, out_clips = self._out_meter
+        block_size = self.config.block_size
         
         return {
             'is_running': self.state.is_running,
@@ -788,15 +1556,25 @@ class ASIOAudioStream:
             'latency_ms': self.state.latency_ms,
             'input_level': self.state.input_level,
             'output_level': self.state.output_level,
+            'input_peaks': in_peaks.copy(),
+            'input_rms': np.sqrt(in_sum_sq / block_size),
+            'input_clips': in_clips.copy(),
+            'output_peaks': out_peaks.copy(),
+            'output_rms': np.sqrt(out_sum_sq / block_size),
+            'output_clips': out_clips.copy(),
             'buffer_underruns': self.state.buffer_underruns,
             'buffer_overruns': self.state.buffer_overruns,
-            'blocks_processed': self.stats['blocks_in'],
+            'blocks_processed': self.state.blocks_processed,
             'elapsed_seconds': elapsed,
-            'input_buffer_size': len(self.input_buffer),
-            'output_buffer_size': len(self.output_buffer)
+            'input_buffer_size': self._in_ring.available() // block_size,
+            'output_buffer_size': self._out_ring.available() // block_size
         }
 
 
+# Script autonome d'ouverture du panneau de configuration ASIO
+_CONTROL_PANEL_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "asio_control_panel.py")
+
+
 class ASIOBridgeServer:
     """
     Serveur WebSocket pour le bridge ASIO
@@ -820,18 +1598,60 @@ class ASIOBridgeServer:
         # Instance du driver ASIO chargé (reste actif)
         self.asio_driver = ASIODriverInstance()
         
+        # Thread unique pour les appels bloquants au driver (registre, COM):
+        # hors de la boucle asyncio, et toujours sur le même thread COM
+        self._driver_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asio-driver")
+        
         # Flux audio
         self.audio_stream: Optional[ASIOAudioStream] = None
         
-        # Clients connectés
+        # Clients connectés (modifiés uniquement depuis la boucle asyncio:
+        # pas de verrou nécessaire)
         self.clients: Dict[str, WebSocketServerProtocol] = {}
-        self._client_lock = asyncio.Lock()
+        self._client_ids = itertools.count(1)
         
         # État
         self.running = False
         
         # Tâche d'envoi audio
         self._audio_send_task: Optional[asyncio.Task] = None
+        
+        # File unique de l'audio reçu (tous clients), vidée par une seule
+        # tâche pour toute la durée du serveur (créées dans start()).
+        # Bornée en durée (total des frames en attente), recalculée au START_STREAM
+        self._audio_in_queue: Optional[asyncio.Queue] = None
+        self._audio_recv_task: Optional[asyncio.Task] = None
+        self._audio_in_limit = _audio_in_queue_limit(self.config)
+        self._audio_in_frames = 0
+        
+        # Trame binaire d'envoi réutilisée (agrandie si nécessaire)
+        self._tx_frame = bytearray()
+        self._tx_scratch = np.empty(0, dtype=np.float32)
+        
+        # Forme attendue des trames entrantes, fixée au START_STREAM
+        self._rx_header = b''
+        self._rx_shape = (0, 0)
+        self._rx_frame_size = 0
+        
+        # Tampon de conversion des trames int16 reçues (agrandi si nécessaire)
+        self._rx_scratch = np.empty(0, dtype=np.float32)
+        
+        # Dernier message CONFIG sérialisé, avec la config dont il provient
+        self._config_message: Tuple[Optional[ASIOConfig], str] = (None, '')
+        
+        # Table de dispatch des actions (construite une seule fois)
+        self._handlers: Dict[str, Callable] = {
+            "PING": self._handle_ping,
+            "GET_DEVICES": self._handle_get_devices,
+            "SET_CONFIG": self._handle_set_config,
+            "GET_CONFIG": self._handle_get_config,
+            "START_STREAM": self._handle_start_stream,
+            "STOP_STREAM": self._handle_stop_stream,
+            "GET_STATS": self._handle_get_stats,
+            "AUDIO_DATA": self._handle_audio_data,
+            "RESCAN_DEVICES": self._handle_rescan_devices,
+            "OPEN_CONTROL_PANEL": self._handle_open_control_panel,
+        }
     
     async def start(self):
         """Démarrer le serveur"""
@@ -847,6 +1667,11 @@ class ASIOBridgeServer:
         
         self.running = True
         
+        # Tâche d'écriture de l'audio reçu
+        self._audio_in_queue = asyncio.Queue()
+        self._audio_in_frames = 0
+        self._audio_recv_task = asyncio.create_task(self._audio_recv_loop())
+        
         # Démarrer le serveur WebSocket
         async with websockets.serve(
             self._handle_connection,
@@ -854,7 +1679,8 @@ class ASIOBridgeServer:
             self.port,
             ping_interval=30,
             ping_timeout=10,
-            max_size=10 * 1024 * 1024  # 10MB max
+            max_size=10 * 1024 * 1024,  # 10MB max
+            compression=None  # Pas de permessage-deflate sur l'audio (CPU, latence)
         ):
             logger.info(f"✅ ASIO Bridge listening on ws://{self.host}:{self.port}")
             logger.info("=" * 60)
@@ -864,51 +1690,69 @@ class ASIOBridgeServer:
     
     async def _handle_connection(self, websocket: WebSocketServerProtocol):
         """Gérer une nouvelle connexion"""
-        client_id = f"client_{int(time.time() * 1000)}"
+        client_id = f"client_{next(self._client_ids)}"
         
-        async with self._client_lock:
-            self.clients[client_id] = websocket
+        self.clients[client_id] = websocket
         
         logger.info(f"🔗 New connection: {client_id}")
         
         try:
             async for message in websocket:
                 try:
-                    # Essayer de parser comme JSON
-                    if isinstance(message, str):
-                        data = json.loads(message)
-                        await self._handle_message(client_id, data)
+                    # Message binaire = audio (chemin chaud, testé en premier)
+                    if type(message) is bytes:
+                        self._queue_audio(client_id, message)
                     else:
-                        # Message binaire = audio
-                        await self._handle_binary(client_id, message)
+                        # Message texte = JSON
+                        data = _json_loads(message)
+                        await self._handle_message(client_id, data)
                 except json.JSONDecodeError:
                     logger.warning(f"Invalid JSON from {client_id}")
                 except Exception as e:
                     logger.error(f"Error handling message: {e}")
         finally:
-            async with self._client_lock:
-                if client_id in self.clients:
-                    del self.clients[client_id]
+            self.clients.pop(client_id, None)
             logger.info(f"🔌 Disconnected: {client_id}")
     
+    def _queue_audio(self, client_id: str, message: bytes):
+        """
+        Empiler une trame audio reçue pour la tâche _audio_recv_loop
+        
+        Au-delà de _AUDIO_IN_MAX_SECONDS d'audio en attente (somme des
+        num_samples des en-têtes), les plus anciennes trames sont abandonnées.
+        """
+        frames = _AUDIO_HEADER.unpack_from(message)[0] if len(message) >= _AUDIO_HEADER.size else 0
+        audio_queue = self._audio_in_queue
+        audio_queue.put_nowait((client_id, message, frames))
+        self._audio_in_frames += frames
+        
+        # La trame qui vient d'arriver est toujours gardée
+        while self._audio_in_frames > self._audio_in_limit and audio_queue.qsize() > 1:
+            self._audio_in_frames -= audio_queue.get_nowait()[2]
+            logger.debug(f"Audio input queue full, oldest frame dropped ({client_id})")
+    
+    async def _audio_recv_loop(self):
+        """
+        Écrire vers la sortie les trames audio reçues de tous les clients
+        
+        Attend la première trame puis vide d'un coup tout ce qui s'est
+        accumulé, sans rendre la main à la boucle entre deux trames.
+        """
+        audio_queue = self._audio_in_queue
+        while True:
+            client_id, message, frames = await audio_queue.get()
+            self._audio_in_frames -= frames
+            await self._handle_binary(client_id, message)
+            while not audio_queue.empty():
+                client_id, message, frames = audio_queue.get_nowait()
+                self._audio_in_frames -= frames
+                await self._handle_binary(client_id, message)
+    
     async def _handle_message(self, client_id: str, data: dict):
         """Router les messages"""
         action = data.get("action", "")
         
-        handlers = {
-            "PING": self._handle_ping,
-            "GET_DEVICES": self._handle_get_devices,
-            "SET_CONFIG": self._handle_set_config,
-            "GET_CONFIG": self._handle_get_config,
-            "START_STREAM": self._handle_start_stream,
-            "STOP_STREAM": self._handle_stop_stream,
-            "GET_STATS": self._handle_get_stats,
-            "AUDIO_DATA": self._handle_audio_data,
-            "RESCAN_DEVICES": self._handle_rescan_devices,
-            "OPEN_CONTROL_PANEL": self._handle_open_control_panel,
-        }
-        
-        handler = handlers.get(action)
+        handler = self._handlers.get(action)
         if handler:
             await handler(client_id, data)
         else:
@@ -918,18 +1762,52 @@ class ASIOBridgeServer:
         """
         Gérer les données audio binaires
         
-        Format: 4 bytes (num_samples int32) + audio data (float32)
+        Format: 4 bytes (num_samples uint32) + 4 bytes (num_channels uint32)
+        + audio data entrelacé, float32 ou int16 selon config.transport_dtype
+        (une trame d'un autre format est rejetée)
         """
         if self.audio_stream and self.audio_stream.state.is_running:
             try:
+                i16 = self.config.transport_dtype == 'i16'
+                
+                # Chemin rapide: bloc float32 de la taille configurée (en-tête connu)
+                if not i16 and len(data) == self._rx_frame_size and data.startswith(self._rx_header):
+                    self.audio_stream.write_output(np.frombuffer(
+                        data, dtype=np.float32, offset=_AUDIO_HEADER.size
+                    ).reshape(self._rx_shape))
+                    return
+                
                 # Décoder l'en-tête
-                num_samples = struct.unpack('<I', data[:4])[0]
-                num_channels = struct.unpack('<I', data[4:8])[0]
+                if len(data) < _AUDIO_HEADER.size:
+                    logger.warning(f"Audio frame too short from {client_id}: {len(data)} bytes")
+                    return
+                num_samples, num_channels = _AUDIO_HEADER.unpack_from(data, 0)
+                count = num_samples * num_channels
+                
+                payload_size = len(data) - _AUDIO_HEADER.size
                 
-                # Décoder les données audio
-                audio_bytes = data[8:]
-                audio_data = np.frombuffer(audio_bytes, dtype=np.float32)
-                audio_data = audio_data.reshape((num_samples, num_channels))
+                if not count or payload_size != count * (2 if i16 else 4):
+                    # Rejeter une trame incohérente avec son en-tête ou le format configuré
+                    logger.warning(f"Invalid audio frame from {client_id}: {len(data)} bytes "
+                                   f"for {num_samples}x{num_channels} {self.config.transport_dtype}")
+                    return
+                
+                if i16:
+                    # int16: conversion dans un tampon float32 pré-alloué
+                    if self._rx_scratch.size < count:
+                        self._rx_scratch = np.empty(count, dtype=np.float32)
+                    audio_data = self._rx_scratch[:count].reshape(num_samples, num_channels)
+                    samples = np.frombuffer(
+                        data, dtype=np.int16,
+                        count=count, offset=_AUDIO_HEADER.size
+                    ).reshape(num_samples, num_channels)
+                    np.multiply(samples, np.float32(1.0 / 32767.0), out=audio_data)
+                else:
+                    # Vue directe sur la trame (pas de copie du payload)
+                    audio_data = np.frombuffer(
+                        data, dtype=np.float32,
+                        count=count, offset=_AUDIO_HEADER.size
+                    ).reshape(num_samples, num_channels)
                 
                 # Écrire vers la sortie
                 self.audio_stream.write_output(audio_data)
@@ -939,40 +1817,92 @@ class ASIOBridgeServer:
     
     async def _send(self, client_id: str, data: dict):
         """Envoyer un message à un client"""
-        if client_id in self.clients:
+        websocket = self.clients.get(client_id)
+        if websocket is not None:
             try:
-                await self.clients[client_id].send(json.dumps(data))
+                await websocket.send(_json_dumps(data))
             except Exception as e:
                 logger.error(f"Send error: {e}")
     
-    async def _send_binary(self, client_id: str, audio_data: np.ndarray):
-        """Envoyer des données audio binaires"""
-        if client_id in self.clients:
+    async def _send_text(self, client_id: str, message: str):
+        """Envoyer un message JSON déjà sérialisé à un client"""
+        websocket = self.clients.get(client_id)
+        if websocket is not None:
             try:
-                # Encoder: 4 bytes (samples) + 4 bytes (channels) + data
-                num_samples, num_channels = audio_data.shape
-                header = struct.pack('<II', num_samples, num_channels)
-                audio_bytes = audio_data.astype(np.float32).tobytes()
-                
-                await self.clients[client_id].send(header + audio_bytes)
+                await websocket.send(message)
             except Exception as e:
-                logger.error(f"Send binary error: {e}")
+                logger.error(f"Send error: {e}")
+    
+    def _encode_audio_frame(self, audio_data: np.ndarray) -> memoryview:
+        """
+        Encoder un bloc audio dans la trame d'envoi pré-allouée
+        
+        Format: 4 bytes (samples) + 4 bytes (channels) + data (float32 ou
+        int16 selon config.transport_dtype), écrits directement dans la trame
+        (pas de concaténation ni de tobytes). Le client déduit le format de
+        la taille du payload. La vue retournée n'est valide que jusqu'au
+        prochain appel.
+        """
+        num_samples, num_channels = audio_data.shape
+        count = num_samples * num_channels
+        quantize = self.config.transport_dtype == 'i16'
+        size = 8 + count * (2 if quantize else 4)
+        if len(self._tx_frame) < size:
+            self._tx_frame = bytearray(size)
+        
+        frame = self._tx_frame
+        _AUDIO_HEADER.pack_into(frame, 0, num_samples, num_channels)
+        if quantize:
+            payload = np.frombuffer(frame, dtype=np.int16, count=count, offset=8)
+            payload = payload.reshape(num_samples, num_channels)
+            if _quantize_i16 is not None:
+                # Noyau compilé: une seule passe, directement dans la trame
+                _quantize_i16(audio_data, payload)
+            else:
+                # Quantification int16 via un tampon float32 pré-alloué
+                if self._tx_scratch.size < count:
+                    self._tx_scratch = np.empty(count, dtype=np.float32)
+                scratch = self._tx_scratch[:count].reshape(num_samples, num_channels)
+                np.multiply(audio_data, 32767.0, out=scratch)
+                np.clip(scratch, -32768.0, 32767.0, out=scratch)
+                np.copyto(payload, scratch, casting='unsafe')
+        else:
+            payload = np.frombuffer(frame, dtype=np.float32, count=count, offset=8)
+            payload.reshape(num_samples, num_channels)[...] = audio_data
+        return memoryview(frame)[:size]
+    
+    async def _send_binary(self, client_id: str, websocket: WebSocketServerProtocol,
+                           frame: memoryview):
+        """Envoyer une trame audio binaire déjà encodée"""
+        try:
+            await websocket.send(frame)
+        except websockets.ConnectionClosed:
+            # Client parti: le retirer tout de suite des diffusions suivantes,
+            # sans attendre la fin de _handle_connection
+            self.clients.pop(client_id, None)
+        except Exception as e:
+            logger.error(f"Send binary error: {e}")
     
     async def _broadcast_audio(self):
         """Diffuser l'audio d'entrée à tous les clients"""
         while self.running and self.audio_stream and self.audio_stream.state.is_running:
             try:
-                # Lire l'audio d'entrée
-                input_data = self.audio_stream.read_input()
+                # Attendre le signal du thread audio (pas de polling)
+                await self.audio_stream.wait_input()
                 
-                if input_data is not None:
-                    # Envoyer à tous les clients
-                    async with self._client_lock:
-                        for client_id in list(self.clients.keys()):
-                            await self._send_binary(client_id, input_data)
-                else:
-                    # Pas de données, attendre un peu
-                    await asyncio.sleep(0.001)
+                # Regrouper tous les blocs d'entrée en attente dans une seule trame
+                input_data = self.audio_stream.read_input_batch()
+                while input_data is not None:
+                    # Instantané des clients, envois en parallèle
+                    clients_snapshot = tuple(self.clients.items())
+                    
+                    # Encoder une seule fois pour tous les clients
+                    frame = self._encode_audio_frame(input_data)
+                    await asyncio.gather(
+                        *(self._send_binary(client_id, ws, frame)
+                          for client_id, ws in clients_snapshot)
+                    )
+                    input_data = self.audio_stream.read_input_batch()
                     
             except Exception as e:
                 logger.error(f"Broadcast audio error: {e}")
@@ -991,21 +1921,13 @@ class ASIOBridgeServer:
     
     async def _handle_get_devices(self, client_id: str, data: dict):
         """Envoyer la liste des périphériques"""
-        await self._send(client_id, {
-            "action": "DEVICES",
-            "devices": self.device_manager.get_devices(),
-            "asio_devices": self.device_manager.get_asio_devices()
-        })
+        await self._send_text(client_id, self.device_manager.get_devices_message())
     
     async def _handle_rescan_devices(self, client_id: str, data: dict):
-        """Rescanner les périphériques"""
-        self.device_manager.rescan()
+        """Rescanner les périphériques (dans un thread, sans bloquer la boucle)"""
+        await asyncio.to_thread(self.device_manager.rescan)
         
-        await self._send(client_id, {
-            "action": "DEVICES",
-            "devices": self.device_manager.get_devices(),
-            "asio_devices": self.device_manager.get_asio_devices()
-        })
+        await self._send_text(client_id, self.device_manager.get_devices_message())
     
     async def _handle_open_control_panel(self, client_id: str, data: dict):
         """
@@ -1031,18 +1953,22 @@ class ASIOBridgeServer:
             return
         
         try:
-            import subprocess
-            
-            # Chemin vers le script autonome
-            script_path = os.path.join(os.path.dirname(__file__), "asio_control_panel.py")
-            
-            logger.info(f"   Lancement du script: {script_path}")
+            logger.info(f"   Lancement du script: {_CONTROL_PANEL_SCRIPT}")
             logger.info(f"   Driver: {device_name}")
             
+            # Transmettre le CLSID déjà lu lors du scan: le script n'a pas
+            # à reparcourir le registre
+            args = [sys.executable, _CONTROL_PANEL_SCRIPT, device_name]
+            driver = self.device_manager.get_device_by_name(device_name)
+            if driver and driver['name'] == device_name and driver.get('clsid'):
+                args.append(driver['clsid'])
+            
             # Lancer dans un processus séparé (non-bloquant)
-            # Le processus gère son propre COM, HWND et message pump
-            process = subprocess.Popen(
-                [sys.executable, script_path, device_name],
+            # Le processus gère son propre COM, HWND et message pump.
+            # La création du processus est bloquante: faite hors de la boucle
+            process = await asyncio.to_thread(
+                subprocess.Popen,
+                args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
@@ -1113,22 +2039,26 @@ class ASIOBridgeServer:
         pour qu'il apparaisse dans la barre des tâches Windows
         """
         try:
-            driver_changed = False
-            new_device_name = data.get("device_name")
+            # Convertir tous les champs reçus avant d'appliquer quoi que ce
+            # soit: une valeur invalide laisse la config intacte
+            updates = {key: parse(data[key]) for key, parse in _CONFIG_FIELDS.items() if key in data}
             
             # Vérifier si le driver a changé
-            if new_device_name and new_device_name != self.config.device_name:
-                driver_changed = True
-                self.config.device_name = new_device_name
+            new_device_name = data.get("device_name")
+            driver_changed = bool(new_device_name) and new_device_name != self.config.device_name
+            if driver_changed:
+                updates["device_name"] = new_device_name
+            
+            # Nouvelle config en une seule copie
+            self.config = replace(self.config, **updates)
             
-            if "sample_rate" in data:
-                self.config.sample_rate = int(data["sample_rate"])
-            if "block_size" in data:
-                self.config.block_size = int(data["block_size"])
-            if "input_channels" in data:
-                self.config.input_channels = int(data["input_channels"])
-            if "output_channels" in data:
-                self.config.output_channels = int(data["output_channels"])
+            # Un flux arrêté garde son périphérique ouvert (STOP_STREAM): le
+            # fermer s'il ne correspond plus, avant tout chargement de driver
+            # (un driver ASIO ne s'ouvre qu'une fois à la fois)
+            stream = self.audio_stream
+            if (stream is not None and stream.stream is not None and not stream.state.is_running
+                    and _stream_fingerprint(stream.config) != _stream_fingerprint(self.config)):
+                stream.stop()
             
             # Si le driver a changé, charger le nouveau driver ASIO
             driver_loaded = False
@@ -1138,27 +2068,26 @@ class ASIOBridgeServer:
                 logger.info(f"🔄 Changement de driver ASIO: {self.config.device_name}")
                 
                 # Charger le driver (il restera actif et apparaîtra dans la barre des tâches)
-                driver_loaded = self.asio_driver.load(self.config.device_name)
+                driver_loaded = await asyncio.get_running_loop().run_in_executor(
+                    self._driver_executor, self.asio_driver.load, self.config.device_name
+                )
                 
                 if driver_loaded:
                     driver_info = self.asio_driver.get_info()
                     # Mettre à jour la config avec les infos du driver
-                    self.config.input_channels = self.asio_driver.input_channels
-                    self.config.output_channels = self.asio_driver.output_channels
-                    self.config.sample_rate = self.asio_driver.sample_rate
+                    self.config = replace(
+                        self.config,
+                        input_channels=self.asio_driver.input_channels,
+                        output_channels=self.asio_driver.output_channels,
+                        sample_rate=self.asio_driver.sample_rate
+                    )
             
             await self._send(client_id, {
                 "action": "CONFIG_SET",
                 "success": True,
                 "driver_loaded": driver_loaded,
                 "driver_info": driver_info,
-                "config": {
-                    "device_name": self.config.device_name,
-                    "sample_rate": self.config.sample_rate,
-                    "block_size": self.config.block_size,
-                    "input_channels": self.config.input_channels,
-                    "output_channels": self.config.output_channels
-                }
+                "config": self._public_config()
             })
             
         except Exception as e:
@@ -1173,29 +2102,55 @@ class ASIOBridgeServer:
     
     async def _handle_get_config(self, client_id: str, data: dict):
         """Récupérer la configuration actuelle"""
-        await self._send(client_id, {
-            "action": "CONFIG",
-            "config": {
-                "device_name": self.config.device_name,
-                "sample_rate": self.config.sample_rate,
-                "block_size": self.config.block_size,
-                "input_channels": self.config.input_channels,
-                "output_channels": self.config.output_channels
-            }
-        })
+        # self.config est remplacée (jamais modifiée) à chaque SET_CONFIG:
+        # le message reste valable tant que c'est le même objet
+        config, message = self._config_message
+        if config is not self.config:
+            message = _json_dumps({
+                "action": "CONFIG",
+                "config": self._public_config()
+            })
+            self._config_message = (self.config, message)
+        await self._send_text(client_id, message)
+    
+    def _public_config(self) -> Dict[str, Any]:
+        """Configuration courante telle que renvoyée aux clients"""
+        config = self.config
+        return {name: getattr(config, name) for name in _PUBLIC_CONFIG_FIELDS}
     
     async def _handle_start_stream(self, client_id: str, data: dict):
-        """Démarrer le flux audio"""
-        # Arrêter le flux existant si actif
-        if self.audio_stream and self.audio_stream.state.is_running:
-            self.audio_stream.stop()
+        """
+        Démarrer le flux audio
         
-        # Créer un nouveau flux
-        self.audio_stream = ASIOAudioStream(self.config)
+        Si la configuration du périphérique n'a pas changé, le flux existant
+        (resté ouvert après STOP_STREAM) est relancé sans le rouvrir.
+        """
+        stream = self.audio_stream
+        if stream is not None and _stream_fingerprint(stream.config) == _stream_fingerprint(self.config):
+            # Seuls des champs côté clients (transport_dtype...) ont pu changer
+            stream.config = self.config
+        else:
+            # Arrêter et fermer le flux existant
+            if stream is not None and (stream.state.is_running or stream.stream is not None):
+                stream.stop()
+            
+            # Créer un nouveau flux
+            self.audio_stream = ASIOAudioStream(self.config, device_manager=self.device_manager)
+            self.audio_stream.bind_event_loop(asyncio.get_running_loop())
+            
+            # Spécialiser le décodage des trames entrantes sur la config du flux
+            block_size, channels = self.config.block_size, self.config.output_channels
+            self._rx_header = _AUDIO_HEADER.pack(block_size, channels)
+            self._rx_shape = (block_size, channels)
+            self._rx_frame_size = _AUDIO_HEADER.size + block_size * channels * 4
+            self._audio_in_limit = _audio_in_queue_limit(self.config)
         
-        if self.audio_stream.start():
-            # Démarrer la diffusion audio
-            self._audio_send_task = asyncio.create_task(self._broadcast_audio())
+        # Ouverture (si nécessaire) puis démarrage
+        if self.audio_stream.prepare() and self.audio_stream.start():
+            # Démarrer la diffusion audio (la tâche encore active, qui suit
+            # self.audio_stream, est réutilisée lors d'un redémarrage)
+            if self._audio_send_task is None or self._audio_send_task.done():
+                self._audio_send_task = asyncio.create_task(self._broadcast_audio())
             
             await self._send(client_id, {
                 "action": "STREAM_STARTED",
@@ -1211,12 +2166,16 @@ class ASIOBridgeServer:
     
     async def _handle_stop_stream(self, client_id: str, data: dict):
         """Arrêter le flux audio"""
-        if self._audio_send_task:
-            self._audio_send_task.cancel()
+        task = self._audio_send_task
+        if task:
             self._audio_send_task = None
+            task.cancel()
+            # Laisser la diffusion se terminer avant d'arrêter le flux
+            await asyncio.wait({task}, timeout=0.1)
         
+        # Garder le périphérique ouvert pour un redémarrage rapide
         if self.audio_stream:
-            self.audio_stream.stop()
+            self.audio_stream.stop(close=False)
         
         await self._send(client_id, {
             "action": "STREAM_STOPPED",
@@ -1229,33 +2188,22 @@ class ASIOBridgeServer:
         if self.audio_stream:
             stats = self.audio_stream.get_stats()
         
-        await self._send(client_id, {
-            "action": "STATS",
-            "stats": stats
-        })
+        # Enveloppe pré-sérialisée: seules les statistiques sont encodées
+        await self._send_text(client_id, f"{_STATS_ENVELOPE}{_json_dumps(stats)}}}")
     
     async def _handle_audio_data(self, client_id: str, data: dict):
         """
-        Recevoir des données audio en JSON (base64)
+        Refuser l'audio JSON (base64)
         
-        Alternative au format binaire pour les navigateurs
+        L'audio doit être envoyé en trames binaires (voir _handle_binary):
+        le base64 coûte ~33% de bande passante et un décodage par bloc.
         """
-        if self.audio_stream and self.audio_stream.state.is_running:
-            try:
-                # Décoder depuis base64
-                audio_base64 = data.get("audio", "")
-                channels = data.get("channels", 2)
-                samples = data.get("samples", self.config.block_size)
-                
-                audio_bytes = base64.b64decode(audio_base64)
-                audio_data = np.frombuffer(audio_bytes, dtype=np.float32)
-                audio_data = audio_data.reshape((samples, channels))
-                
-                # Écrire vers la sortie
-                self.audio_stream.write_output(audio_data)
-                
-            except Exception as e:
-                logger.error(f"Error processing audio data: {e}")
+        logger.warning(f"AUDIO_DATA refusé pour {client_id}: utiliser les trames binaires")
+        await self._send(client_id, {
+            "action": "ERROR",
+            "error": "AUDIO_DATA (base64) n'est plus supporté: envoyer l'audio en trames binaires "
+                     "[uint32 num_samples][uint32 num_channels][float32[] interleaved]"
+        })
     
     def stop(self):
         """Arrêter le serveur"""
@@ -1264,9 +2212,19 @@ class ASIOBridgeServer:
         if self._audio_send_task:
             self._audio_send_task.cancel()
         
+        # Tâche d'écriture de l'audio reçu (bloquée sur la file sinon)
+        if self._audio_recv_task:
+            self._audio_recv_task.cancel()
+            self._audio_recv_task = None
+        
         if self.audio_stream:
             self.audio_stream.stop()
         
+        # Abandonner les appels au driver en attente, puis libérer le driver
+        # (unload attend la fin d'un chargement en cours via son verrou)
+        self._driver_executor.shutdown(wait=False, cancel_futures=True)
+        self.asio_driver.unload()
+        
         logger.info("🛑 ASIO Bridge stopped")
 
 
@@ -1284,4 +2242,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if FAST_LOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
@@ -13,7 +13,9 @@ import sys
 import ctypes
 from ctypes import wintypes
 import time
+import uuid
 import logging
+from typing import Optional
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s', datefmt='%H:%M:%S')
 logger = logging.getLogger('ASIOPanel')
@@ -70,15 +72,9 @@ class GUID(ctypes.Structure):
 
 def parse_guid(clsid_str: str) -> GUID:
     """Parser une chaîne CLSID en structure GUID"""
-    clsid_clean = clsid_str.strip('{}')
-    parts = clsid_clean.split('-')
+    # bytes_le: disposition mémoire d'un GUID Windows (Data1-3 little-endian)
     guid = GUID()
-    guid.Data1 = int(parts[0], 16)
-    guid.Data2 = int(parts[1], 16)
-    guid.Data3 = int(parts[2], 16)
-    data4_hex = parts[3] + parts[4]
-    for i in range(8):
-        guid.Data4[i] = int(data4_hex[i*2:i*2+2], 16)
+    ctypes.memmove(ctypes.byref(guid), uuid.UUID(clsid_str).bytes_le, ctypes.sizeof(guid))
     return guid
 
 
@@ -171,19 +167,22 @@ def run_message_pump(timeout_seconds: float = 30.0):
     logger.info("   Message pump terminé")
 
 
-def open_asio_control_panel(driver_name: str) -> bool:
+def open_asio_control_panel(driver_name: str, clsid: Optional[str] = None) -> bool:
     """
     Ouvrir le panneau de configuration ASIO
     
     IMPORTANT: Le SDK ASIO utilise le CLSID du driver comme IID
     (pas IID_IUnknown!) lors de CoCreateInstance.
+    
+    Si le CLSID est fourni (déjà lu par le bridge), le registre n'est pas relu.
     """
     ole32 = ctypes.windll.ole32
     
     logger.info(f"🎛️ Ouverture du panneau ASIO: {driver_name}")
     
     # 1. Trouver le CLSID
-    clsid = find_driver_clsid(driver_name)
+    if not clsid:
+        clsid = find_driver_clsid(driver_name)
     if not clsid:
         logger.error(f"   ❌ CLSID non trouvé pour: {driver_name}")
         return False
@@ -312,10 +311,11 @@ def open_asio_control_panel(driver_name: str) -> bool:
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python asio_control_panel.py <driver_name>")
+        print("Usage: python asio_control_panel.py <driver_name> [clsid]")
         print('Example: python asio_control_panel.py "FL Studio ASIO"')
         sys.exit(1)
     
     driver_name = sys.argv[1]
-    success = open_asio_control_panel(driver_name)
+    clsid = sys.argv[2] if len(sys.argv) > 2 else None
+    success = open_asio_control_panel(driver_name, clsid)
     sys.exit(0 if success else 1)
\ No newline at end of file
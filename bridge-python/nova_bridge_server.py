@@ -16,11 +16,29 @@ import json
 import logging
 import time
 import threading
+import sys
 from typing import Dict, Optional, Any, List, Set
 from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
+# orjson pour sérialiser les messages JSON (optionnel)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Boucle asyncio accélérée (optionnel): winloop sur Windows, uvloop ailleurs
+try:
+    if sys.platform == 'win32':
+        import winloop as fast_loop
+    else:
+        import uvloop as fast_loop
+    FAST_LOOP_AVAILABLE = True
+except ImportError:
+    FAST_LOOP_AVAILABLE = False
+
 # WebSocket
 import websockets
 from websockets.server import WebSocketServerProtocol
@@ -37,6 +55,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger('NovaBridge')
 
+if ORJSON_AVAILABLE:
+    def _json_dumps(data: Any) -> str:
+        """Sérialiser avec orjson (décodé pour rester en trame texte)"""
+        return orjson.dumps(data).decode()
+    
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 
 @dataclass
 class ClientSession:
@@ -145,7 +173,7 @@ class NovaBridgeServer:
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = _json_loads(message)
                     await self._handle_message(client_id, data)
                 except json.JSONDecodeError:
                     logger.warning(f"Invalid JSON from {client_id}")
@@ -200,7 +228,7 @@ class NovaBridgeServer:
         """Envoyer un message à un client"""
         if client_id in self.sessions:
             try:
-                await self.sessions[client_id].websocket.send(json.dumps(data))
+                await self.sessions[client_id].websocket.send(_json_dumps(data))
             except Exception as e:
                 logger.error(f"Send error to {client_id}: {e}")
 
@@ -558,4 +586,6 @@ async def main():
         server.stop()
 
 if __name__ == "__main__":
+    if FAST_LOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
     asyncio.run(main())
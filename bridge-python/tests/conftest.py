@@ -0,0 +1,77 @@
+"""
+Fixtures communes des tests du bridge ASIO
+
+sounddevice est remplacé par un module factice avant l'import de
+asio_bridge: les tests tournent sans PortAudio ni périphérique audio.
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+class FakeCallbackFlags:
+    """Équivalent de sd.CallbackFlags construit depuis des booléens"""
+
+    def __init__(self, input_overflow=False, output_underflow=False, priming_output=False):
+        self.input_overflow = input_overflow
+        self.output_underflow = output_underflow
+        self.priming_output = priming_output
+
+    def __bool__(self):
+        return self.input_overflow or self.output_underflow or self.priming_output
+
+
+class FakeStream:
+    """sd.Stream factice: garde ses arguments, le callback est appelé par le test"""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.callback = kwargs['callback']
+        self.latency = (0.005, 0.005)
+        self.active = False
+        self.closed = False
+        fake_sounddevice.streams.append(self)
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.closed = True
+
+
+def _query_devices(device=None, kind=None):
+    if device is None and kind is None:
+        return list(fake_sounddevice.devices)
+    return fake_sounddevice.devices[0]
+
+
+def _query_hostapis():
+    return list(fake_sounddevice.hostapis)
+
+
+fake_sounddevice = types.ModuleType('sounddevice')
+fake_sounddevice.CallbackFlags = FakeCallbackFlags
+fake_sounddevice.Stream = FakeStream
+fake_sounddevice.query_devices = _query_devices
+fake_sounddevice.query_hostapis = _query_hostapis
+fake_sounddevice.devices = []
+fake_sounddevice.hostapis = []
+fake_sounddevice.streams = []
+sys.modules['sounddevice'] = fake_sounddevice
+
+
+@pytest.fixture
+def fake_sd():
+    """Module sounddevice factice, remis à zéro pour chaque test"""
+    fake_sounddevice.devices = []
+    fake_sounddevice.hostapis = [{'name': 'MME'}, {'name': 'ASIO'}]
+    fake_sounddevice.streams = []
+    return fake_sounddevice
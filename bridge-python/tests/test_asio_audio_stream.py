@@ -0,0 +1,111 @@
+"""
+Tests du flux audio ASIO (callback temps réel piloté à la main, sounddevice factice)
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from asio_bridge import ASIOAudioStream, ASIOConfig
+from conftest import FakeCallbackFlags
+
+
+def test_input_callback_receives_every_block_past_ring_capacity():
+    """Sans lecteur read_input(), le callback utilisateur reçoit tous les blocs"""
+    config = ASIOConfig(block_size=32)
+    received = []
+    stream = ASIOAudioStream(config, on_input_callback=lambda block: received.append(block[0, 0]))
+
+    # Thread du callback utilisateur, comme dans start() (sans ouvrir de périphérique)
+    stream._user_cb_thread = threading.Thread(
+        target=stream._run_input_callback, args=(stream._user_cb_queue,), daemon=True
+    )
+    stream._user_cb_thread.start()
+
+    audio_callback = stream._make_audio_callback()
+    indata = np.zeros((config.block_size, config.input_channels), dtype=np.float32)
+    outdata = np.empty((config.block_size, config.output_channels), dtype=np.float32)
+
+    # Bien plus de blocs que la capacité du buffer d'entrée (128 blocs)
+    blocks = 3 * stream._in_ring.capacity // config.block_size
+    try:
+        for i in range(blocks):
+            indata.fill(i / blocks)
+            audio_callback(indata, outdata, config.block_size, None, None)
+
+            # Cadence d'un vrai thread audio: le bloc est remis avant le suivant
+            deadline = time.monotonic() + 1.0
+            while len(received) <= i and time.monotonic() < deadline:
+                time.sleep(0.0005)
+            if len(received) <= i:
+                break  # Bloc jamais remis: inutile de continuer
+    finally:
+        stream._stop_input_callback()
+
+    assert len(received) == blocks
+    assert received == [np.float32(i / blocks) for i in range(blocks)]
+    assert stream.state.buffer_overruns == 0
+
+
+def test_priming_blocks_skip_input_ring_and_meter():
+    """Les blocs d'amorçage de la sortie ne sont ni mesurés ni bufferisés en entrée"""
+    config = ASIOConfig(block_size=32)
+    stream = ASIOAudioStream(config)
+    audio_callback = stream._make_audio_callback()
+    indata = np.full((config.block_size, config.input_channels), 0.5, dtype=np.float32)
+    outdata = np.empty((config.block_size, config.output_channels), dtype=np.float32)
+
+    audio_callback(indata, outdata, config.block_size, None, FakeCallbackFlags(priming_output=True))
+
+    assert stream._in_ring.available() == 0
+    assert stream.state.input_level == 0.0
+    assert not outdata.any()
+
+    audio_callback(indata, outdata, config.block_size, None, FakeCallbackFlags())
+
+    assert stream._in_ring.available() == config.block_size
+    assert stream.state.input_level > 0.0
+
+
+def test_start_clears_rings_of_prepared_stream(fake_sd):
+    """start() part de buffers vides, y compris après un prepare() seul"""
+    fake_sd.devices = [{'name': 'Speakers', 'hostapi': 0}]
+    config = ASIOConfig(block_size=32)
+    stream = ASIOAudioStream(config)
+    assert stream.prepare()
+    stream.write_output(np.ones((config.block_size, config.output_channels), dtype=np.float32))
+
+    try:
+        assert stream.start()
+        assert stream._out_ring.available() == 0
+    finally:
+        stream.stop()
+
+
+def test_blocks_processed_counts_dropped_blocks_and_resets_per_run(fake_sd):
+    fake_sd.devices = [{'name': 'Speakers', 'hostapi': 0}]
+    config = ASIOConfig(block_size=32)
+    stream = ASIOAudioStream(config)
+    indata = np.zeros((config.block_size, config.input_channels), dtype=np.float32)
+    outdata = np.empty((config.block_size, config.output_channels), dtype=np.float32)
+
+    def run_blocks(count):
+        callback = fake_sd.streams[-1].callback
+        for _ in range(count):
+            callback(indata, outdata, config.block_size, None, FakeCallbackFlags())
+
+    try:
+        assert stream.start()
+        # Sans lecteur: le buffer d'entrée déborde, les blocs perdus comptent aussi
+        capacity_blocks = stream._in_ring.capacity // config.block_size
+        run_blocks(capacity_blocks + 2)
+        assert stream.state.buffer_overruns == 2
+        assert stream.get_stats()['blocks_processed'] == capacity_blocks + 2
+
+        stream.stop(close=False)
+        assert stream.start()
+        run_blocks(3)
+        assert stream.get_stats()['blocks_processed'] == 3
+    finally:
+        stream.stop()
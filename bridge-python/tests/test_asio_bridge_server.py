@@ -0,0 +1,209 @@
+"""
+Tests du serveur ASIO (handlers pilotés directement, sounddevice factice)
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from asio_bridge import ASIOBridgeServer, ASIOConfig
+from conftest import FakeCallbackFlags
+
+BLOCK = 32
+
+
+def _device(name='Speakers', hostapi=0):
+    return {
+        'name': name,
+        'hostapi': hostapi,
+        'max_input_channels': 2,
+        'max_output_channels': 2,
+        'default_samplerate': 48000.0,
+    }
+
+
+def _frame(samples, dtype=np.float32):
+    """Trame binaire: en-tête uint32 little-endian + échantillons entrelacés"""
+    header = np.array(samples.shape, dtype='<u4').tobytes()
+    return header + np.ascontiguousarray(samples, dtype=dtype).tobytes()
+
+
+@pytest.fixture
+def loop():
+    """Boucle commune au serveur et au callback audio (appels call_soon_threadsafe)"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def server(fake_sd, loop):
+    fake_sd.devices = [_device()]
+    server = ASIOBridgeServer()
+    server.config = ASIOConfig(block_size=BLOCK)
+    server.sent = []
+
+    async def send(client_id, message):
+        server.sent.append(message)
+    server._send = send
+    yield server
+    if server.audio_stream is not None:
+        server.audio_stream.stop()
+
+
+async def _start(server):
+    await server._handle_start_stream('c', {})
+    assert server.sent[-1]['success']
+
+
+def _play_block(fake_sd, channels=2):
+    """Faire tourner une fois le callback audio et renvoyer la sortie"""
+    indata = np.zeros((BLOCK, channels), dtype=np.float32)
+    outdata = np.full((BLOCK, channels), np.nan, dtype=np.float32)
+    fake_sd.streams[-1].callback(indata, outdata, BLOCK, None, FakeCallbackFlags())
+    return outdata
+
+
+def test_float32_frame_reaches_output(server, fake_sd, loop):
+    samples = np.linspace(-1, 1, BLOCK * 2, dtype=np.float32).reshape(BLOCK, 2)
+
+    async def go():
+        await _start(server)
+        await server._handle_binary('c', _frame(samples))
+    loop.run_until_complete(go())
+
+    np.testing.assert_array_equal(_play_block(fake_sd), samples)
+
+
+def test_int16_frame_decoded_when_transport_is_i16(server, fake_sd, loop):
+    server.config = ASIOConfig(block_size=BLOCK, transport_dtype='i16')
+    quantized = np.arange(-BLOCK, BLOCK, dtype=np.int16).reshape(BLOCK, 2) * 512
+
+    async def go():
+        await _start(server)
+        await server._handle_binary('c', _frame(quantized, np.int16))
+    loop.run_until_complete(go())
+
+    np.testing.assert_allclose(_play_block(fake_sd), quantized / 32767.0, atol=1e-7)
+
+
+@pytest.mark.parametrize('transport, dtype', [('f32', np.int16), ('i16', np.float32)])
+def test_frame_in_other_format_is_rejected(server, fake_sd, loop, transport, dtype):
+    """Une trame dont la taille correspond à l'autre format n'est pas décodée"""
+    server.config = ASIOConfig(block_size=BLOCK, transport_dtype=transport)
+    samples = np.ones((BLOCK, 2))
+
+    async def go():
+        await _start(server)
+        await server._handle_binary('c', _frame(samples, dtype))
+    loop.run_until_complete(go())
+
+    assert server.audio_stream._out_ring.available() == 0
+
+
+def test_truncated_frame_is_rejected(server, fake_sd, loop):
+    frame = _frame(np.ones((BLOCK, 2), dtype=np.float32))
+
+    async def go():
+        await _start(server)
+        await server._handle_binary('c', frame[:-4])
+    loop.run_until_complete(go())
+
+    assert server.audio_stream._out_ring.available() == 0
+
+
+def test_audio_queue_bounded_by_queued_frames(server, loop):
+    """Au-delà de 0.2 s d'audio en attente, les plus anciennes trames sont abandonnées"""
+    server.config = ASIOConfig(sample_rate=48000, block_size=BLOCK)
+
+    async def go():
+        await _start(server)
+        server._audio_in_queue = asyncio.Queue()
+        for i in range(400):
+            server._queue_audio('c', _frame(np.full((BLOCK, 2), i, dtype=np.float32)))
+        # Une grande trame compte pour sa durée, pas pour un seul message
+        server._queue_audio('c', _frame(np.zeros((BLOCK * 100, 2), dtype=np.float32)))
+    loop.run_until_complete(go())
+
+    queued = []
+    while not server._audio_in_queue.empty():
+        queued.append(server._audio_in_queue.get_nowait())
+    limit = int(0.2 * 48000)
+    assert sum(frames for _, _, frames in queued) == server._audio_in_frames <= limit
+    assert len(queued) == (limit - BLOCK * 100) // BLOCK + 1
+    first = np.frombuffer(queued[0][1], dtype=np.float32, offset=8)
+    assert first[0] == 400 - (len(queued) - 1)
+
+
+def test_stop_shuts_down_driver_executor_and_unloads_driver(server, monkeypatch):
+    unloaded = []
+    monkeypatch.setattr(server.asio_driver, 'unload', lambda: unloaded.append(True))
+
+    server.stop()
+
+    assert unloaded == [True]
+    with pytest.raises(RuntimeError):
+        server._driver_executor.submit(print)
+
+
+def test_int16_encode_decode_round_trip(server, fake_sd, loop):
+    """Une trame int16 émise par le bridge est relue à un pas de quantification près"""
+    server.config = ASIOConfig(block_size=BLOCK, transport_dtype='i16')
+    samples = np.linspace(-1, 1, BLOCK * 2, dtype=np.float32).reshape(BLOCK, 2)
+    samples[0] = (1.5, -1.5)  # Saturé
+
+    async def go():
+        await _start(server)
+        frame = bytes(server._encode_audio_frame(samples))
+        assert len(frame) == 8 + samples.size * 2
+        await server._handle_binary('c', frame)
+    loop.run_until_complete(go())
+
+    expected = np.clip(samples, -1, 1)
+    np.testing.assert_allclose(_play_block(fake_sd), expected, atol=1 / 32767)
+
+
+def test_set_config_snaps_block_size(server, loop):
+    loop.run_until_complete(server._handle_set_config('c', {'block_size': 100}))
+
+    assert server.sent[-1]['success']
+    assert server.config.block_size == 96
+    assert server.sent[-1]['config']['block_size'] == 96
+
+
+@pytest.mark.parametrize('data', [
+    {'sample_rate': 48000, 'block_size': 'abc'},
+    {'sample_rate': 48000, 'block_size': 16},
+    {'sample_rate': 48000, 'transport_dtype': 'f64'},
+])
+def test_set_config_invalid_field_leaves_config_intact(server, loop, data):
+    config = server.config
+
+    loop.run_until_complete(server._handle_set_config('c', data))
+
+    assert not server.sent[-1]['success']
+    assert server.config is config
+
+
+def test_start_reuses_open_stream_when_only_transport_changes(server, fake_sd, loop):
+    async def go():
+        await _start(server)
+        stream = server.audio_stream
+        await server._handle_stop_stream('c', {})
+
+        # Format de transport seul: même périphérique, flux relancé sans réouverture
+        await server._handle_set_config('c', {'transport_dtype': 'i16'})
+        await _start(server)
+        assert server.audio_stream is stream
+        assert stream.config.transport_dtype == 'i16'
+        assert len(fake_sd.streams) == 1
+        await server._handle_stop_stream('c', {})
+
+        # Taille de bloc différente: l'ancien flux est fermé, un nouveau est ouvert
+        await server._handle_set_config('c', {'block_size': BLOCK * 2})
+        assert fake_sd.streams[0].closed
+        await _start(server)
+        assert server.audio_stream is not stream
+        assert len(fake_sd.streams) == 2
+    loop.run_until_complete(go())
@@ -0,0 +1,56 @@
+"""
+Tests de la résolution des périphériques par nom (ASIODeviceManager)
+"""
+
+import pytest
+
+import asio_bridge
+from asio_bridge import ASIODeviceManager
+
+
+def _device(name, hostapi):
+    return {
+        'name': name,
+        'hostapi': hostapi,
+        'max_input_channels': 2,
+        'max_output_channels': 2,
+        'default_samplerate': 48000.0,
+    }
+
+
+@pytest.fixture
+def make_manager(fake_sd, monkeypatch):
+    """Construire un gestionnaire à partir de drivers du registre et de devices sounddevice"""
+    def make(registry_names, devices):
+        registry = tuple((i, name, '{00000000-0000-0000-0000-000000000000}', name)
+                         for i, name in enumerate(registry_names))
+        monkeypatch.setattr(asio_bridge, 'WINREG_AVAILABLE', True)
+        monkeypatch.setattr(asio_bridge, '_enumerate_asio_registry', lambda: registry)
+        fake_sd.devices = devices
+        return ASIODeviceManager()
+    return make
+
+
+def test_asio_driver_substring_wins_over_exact_plain_device(make_manager):
+    """Un nom exact d'un device MME reste résolu vers le driver ASIO qui le contient"""
+    manager = make_manager(['Focusrite USB ASIO'], [_device('Focusrite USB', 0)])
+
+    found = manager.get_device_by_name('Focusrite USB')
+
+    assert found['name'] == 'Focusrite USB ASIO'
+    assert found['is_asio']
+
+
+def test_first_matching_asio_driver_wins_over_later_exact_match(make_manager):
+    """Parmi les drivers ASIO, le premier qui correspond l'emporte (ordre du registre)"""
+    manager = make_manager(['Focusrite USB ASIO', 'Focusrite USB'], [])
+
+    assert manager.get_device_by_name('Focusrite USB')['name'] == 'Focusrite USB ASIO'
+    assert manager.get_device_by_name('focusrite usb asio')['name'] == 'Focusrite USB ASIO'
+
+
+def test_plain_devices_searched_when_no_asio_driver_matches(make_manager):
+    manager = make_manager(['ASIO4ALL v2'], [_device('Speakers (Realtek)', 0)])
+
+    assert manager.get_device_by_name('speakers')['name'] == 'Speakers (Realtek)'
+    assert manager.get_device_by_name('unknown') is None
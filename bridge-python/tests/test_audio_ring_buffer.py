@@ -0,0 +1,105 @@
+"""
+Tests du buffer circulaire SPSC (AudioRingBuffer)
+"""
+
+import numpy as np
+
+from asio_bridge import AudioRingBuffer
+
+
+def _block(start, frames, channels=2):
+    """Bloc (frames, channels) de valeurs croissantes, identiques sur chaque canal"""
+    values = np.arange(start, start + frames, dtype=np.float32)
+    return np.repeat(values[:, None], channels, axis=1)
+
+
+def test_capacity_rounded_up_to_power_of_two():
+    assert AudioRingBuffer(100, 2).capacity == 128
+    assert AudioRingBuffer(128, 2).capacity == 128
+    assert AudioRingBuffer(0, 2).capacity == 1
+
+
+def test_write_and_read_wrap_around_end_of_buffer():
+    ring = AudioRingBuffer(8, 2)
+    out = np.empty((6, 2), dtype=np.float32)
+
+    # Avancer les index pour que le bloc suivant fasse le tour du buffer
+    assert ring.write(_block(0, 6))
+    assert ring.read_into(out)
+    assert ring.write(_block(6, 6))
+    assert ring.read_into(out)
+
+    np.testing.assert_array_equal(out, _block(6, 6))
+    assert ring.available() == 0
+    assert ring.write_index == 12
+
+
+def test_write_rejected_when_full():
+    ring = AudioRingBuffer(8, 2)
+
+    assert ring.write(_block(0, 6))
+    assert not ring.write(_block(6, 4))
+    assert ring.available() == 6
+    assert ring.write(_block(6, 2))
+
+
+def test_missing_channels_written_as_silence():
+    ring = AudioRingBuffer(8, 2)
+
+    assert ring.write(np.ones(4, dtype=np.float32))
+
+    np.testing.assert_array_equal(ring.read(4), [[1, 0]] * 4)
+
+
+def test_read_available_into_copies_what_is_there():
+    ring = AudioRingBuffer(8, 2)
+    out = np.full((4, 2), -1, dtype=np.float32)
+
+    assert ring.read_available_into(out) == 0
+    ring.write(_block(0, 6))
+    ring.read(5)
+    ring.write(_block(6, 3))
+
+    # 4 frames disponibles à cheval sur la fin du buffer, out plus court
+    assert ring.read_available_into(out) == 4
+    np.testing.assert_array_equal(out, _block(5, 4))
+    out.fill(-1)
+    assert ring.read_available_into(out) == 0
+    assert (out == -1).all()
+
+
+def test_read_into_requires_enough_frames():
+    ring = AudioRingBuffer(8, 2)
+    ring.write(_block(0, 3))
+
+    assert not ring.read_into(np.empty((4, 2), dtype=np.float32))
+    assert ring.available() == 3
+
+
+def test_view_and_consume_without_copy():
+    ring = AudioRingBuffer(8, 2)
+    start = ring.write_index
+    ring.write(_block(0, 4))
+
+    block = ring.view(start, 4)
+    assert np.shares_memory(block, ring.buffer)
+    np.testing.assert_array_equal(block, _block(0, 4))
+
+    ring.consume(4)
+    assert ring.available() == 0
+
+    # Zone non contiguë: pas de vue possible
+    ring.write(_block(4, 2))
+    start = ring.write_index
+    ring.write(_block(6, 4))
+    assert ring.view(start, 4) is None
+
+
+def test_clear_drops_pending_frames():
+    ring = AudioRingBuffer(8, 2)
+    ring.write(_block(0, 5))
+
+    ring.clear()
+
+    assert ring.available() == 0
+    assert ring.write(_block(0, 8))
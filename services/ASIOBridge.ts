@@ -14,6 +14,7 @@ export interface ASIOConfig {
   block_size: number;
   input_channels: number;
   output_channels: number;
+  transport_dtype?: 'f32' | 'i16';
 }
 
 // Types pour les périphériques audio
@@ -35,6 +36,12 @@ export interface ASIOStats {
   latency_ms: number;
   input_level: number;
   output_level: number;
+  input_peaks: number[];
+  input_rms: number[];
+  input_clips: number[];
+  output_peaks: number[];
+  output_rms: number[];
+  output_clips: number[];
   buffer_underruns: number;
   buffer_overruns: number;
   blocks_processed: number;
@@ -77,6 +84,7 @@ export class ASIOBridgeClient {
   private reconnectDelay = 1000;
   private isConnected = false;
   private pingInterval: NodeJS.Timeout | null = null;
+  private transportDtype: 'f32' | 'i16' = 'f32';
 
   constructor(host: string = '127.0.0.1', port: number = 8766) {
     this.url = `ws://${host}:${port}`;
@@ -176,10 +184,14 @@ export class ASIOBridgeClient {
           break;
 
         case 'CONFIG_SET':
+          if (message.success && message.config) {
+            this.transportDtype = message.config.transport_dtype ?? 'f32';
+          }
           this.handlers.onConfigSet?.(message.success, message.config, message.error);
           break;
 
         case 'CONFIG':
+          this.transportDtype = message.config?.transport_dtype ?? 'f32';
           this.handlers.onConfig?.(message.config);
           break;
 
@@ -195,6 +207,10 @@ export class ASIOBridgeClient {
           this.handlers.onStats?.(message.stats);
           break;
 
+        case 'ERROR':
+          this.handlers.onError?.(message.error);
+          break;
+
         default:
           console.log('[ASIO Bridge] Unknown message:', action);
       }
@@ -212,8 +228,18 @@ export class ASIOBridgeClient {
       const numSamples = view.getUint32(0, true);
       const numChannels = view.getUint32(4, true);
 
-      // Extraire les données audio
-      const audioData = new Float32Array(data, 8);
+      // Extraire les données audio (int16 si le payload fait 2 bytes/échantillon)
+      const numValues = numSamples * numChannels;
+      let audioData: Float32Array;
+      if (numValues > 0 && data.byteLength - 8 === numValues * 2) {
+        const int16Data = new Int16Array(data, 8, numValues);
+        audioData = new Float32Array(numValues);
+        for (let i = 0; i < numValues; i++) {
+          audioData[i] = int16Data[i] / 32767;
+        }
+      } else {
+        audioData = new Float32Array(data, 8);
+      }
 
       this.handlers.onAudioInput?.(audioData, numChannels);
     } catch (error) {
@@ -237,16 +263,25 @@ export class ASIOBridgeClient {
     if (!this.isConnectedToServer()) return;
 
     const numSamples = Math.floor(audioData.length / numChannels);
+    const quantize = this.transportDtype === 'i16';
 
     // Créer le buffer: 4 bytes (samples) + 4 bytes (channels) + audio data
-    const buffer = new ArrayBuffer(8 + audioData.byteLength);
+    const buffer = new ArrayBuffer(8 + audioData.length * (quantize ? 2 : 4));
     const view = new DataView(buffer);
     view.setUint32(0, numSamples, true);
     view.setUint32(4, numChannels, true);
 
-    // Copier les données audio
-    const audioView = new Float32Array(buffer, 8);
-    audioView.set(audioData);
+    // Copier les données audio (quantifiées en int16 si configuré)
+    if (quantize) {
+      const int16View = new Int16Array(buffer, 8);
+      for (let i = 0; i < audioData.length; i++) {
+        const v = audioData[i] * 32767;
+        int16View[i] = v > 32767 ? 32767 : v < -32768 ? -32768 : v;
+      }
+    } else {
+      const audioView = new Float32Array(buffer, 8);
+      audioView.set(audioData);
+    }
 
     this.ws!.send(buffer);
   }